@@ -0,0 +1,38 @@
+"""
+공용 HTTP 클라이언트 모듈
+여러 에이전트의 LLM 호출이 하나의 연결 풀을 공유하여 TCP/TLS 핸드셰이크를 반복하지 않도록 합니다.
+
+h2 패키지가 설치되어 있으면 HTTP/2를 사용하여 동시 요청을 한 연결에서 다중화합니다.
+"""
+import threading
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    프로세스 공용 동기 HTTP 클라이언트를 반환합니다. (최초 호출 시 생성)
+
+    Returns:
+        httpx.Client: 연결 풀을 공유하는 클라이언트
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=60,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                    http2=_HTTP2_AVAILABLE
+                )
+    return _client
@@ -0,0 +1,69 @@
+"""
+LLM 호출 속도 제한 모듈
+고정 대기(sleep) 대신 토큰 버킷으로 실제로 한도를 넘을 때만 대기합니다.
+
+초당 요청 수와 버스트 크기는 환경 변수로 조정할 수 있습니다.
+- LLM_REQUESTS_PER_SECOND (기본값 5)
+- LLM_BURST (기본값 10)
+"""
+import asyncio
+import os
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        TokenBucket 초기화
+
+        Args:
+            rate: 초당 보충되는 토큰 수
+            burst: 버킷 최대 용량 (연속 허용 요청 수)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 예약하고 사용 전까지 기다려야 하는 시간을 반환합니다.
+
+        Returns:
+            float: 대기 시간(초), 즉시 사용 가능하면 0
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            # 부족하더라도 토큰을 미리 차감하여 동시 요청 간 대기 순서를 보장
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def wait(self):
+        """토큰을 얻을 때까지 대기합니다. (동기)"""
+        delay = self.acquire()
+        if delay:
+            time.sleep(delay)
+
+    async def await_token(self):
+        """토큰을 얻을 때까지 대기합니다. (비동기)"""
+        delay = self.acquire()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# 프로세스 공용 LLM 호출 버킷
+LLM_RATE_LIMIT = TokenBucket(
+    rate=float(os.getenv("LLM_REQUESTS_PER_SECOND", "5")),
+    burst=int(os.getenv("LLM_BURST", "10"))
+)
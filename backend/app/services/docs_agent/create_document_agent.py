@@ -4,25 +4,51 @@ from langgraph.checkpoint.memory import MemorySaver
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
-from typing import TypedDict, List, Optional
+from typing import TypedDict, List, Optional, AsyncIterator
 import json
 import yaml
 import time
 import re
 import os
 import uuid
+import io
+import copy
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 from docx import Document
 
-# 외부 도구 임포트
-import sys
-# 상위 디렉토리를 sys.path에 추가하여 tools 모듈에 접근
-sys.path.append(str(Path(__file__).parent.parent))
-from tools.common_tools import check_policy_violation, separate_document_type_and_content
+# 외부 도구 임포트 (공용 HTTP 클라이언트/속도 제한이 모듈 하나로만 로드되도록 패키지 경로로 가져옴)
+from ..tools.common_tools import check_policy_violation, separate_document_type_and_content
+from .semantic_cache import SemanticCache
+from .._http import get_http_client
+from .._rate_limit import LLM_RATE_LIMIT
 
 load_dotenv()
 
+# 위반 검사 결과 항목("문구: 위반 내용") 분리용 - 반각/전각 콜론 모두 지원
+_VIOLATION_ITEM_RE = re.compile(r'^([^:：]*)[:：](.*)$', re.S)
+
+# 의미 기반 캐시 적중을 받아들이려면 요청에 모두 포함되어야 하는 문서 타입별 키워드
+# (임베딩 유사도만으로는 '신청서'와 '결과보고서'처럼 한 단어만 다른 요청을 구분하지 못함)
+_DOC_TYPE_CACHE_KEYWORDS = {
+    "영업방문 결과보고서": ("방문",),
+    "제품설명회 시행 신청서": ("설명회", "신청"),
+    "제품설명회 시행 결과보고서": ("설명회", "결과"),
+}
+
+@functools.lru_cache(maxsize=None)
+def _shared_doc_type_cache() -> SemanticCache:
+    """에이전트 공용 문서 타입 의미 기반 캐시"""
+    return SemanticCache(namespace="doc_type")
+
+# docx 템플릿 미리 읽기 (파일이 인스턴스와 무관하므로 프로세스 공용 스레드 하나에서 한 번만 읽음)
+_TEMPLATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docx_template")
+_docx_templates_future = None
+_docx_templates_lock = threading.Lock()
+
 class State(TypedDict):
     messages: List[HumanMessage]
     doc_type: Optional[str]
@@ -47,13 +73,27 @@ class State(TypedDict):
 class CreateDocumentAgent:
     """통합 문서 작성 에이전트 - 분류부터 생성까지"""
     
-    def __init__(self, model_name: str = "gpt-4o-mini", temperature: float = 0.7):
+    # 문서 타입에 따른 템플릿 파일 매핑 (S3 폴더 기준)
+    DOCX_TEMPLATES = {
+        "영업방문 결과보고서": "영업방문 결과보고서(템플릿형).docx",
+        "제품설명회 시행 신청서": "제품설명회 시행 신청서(템플릿형).docx",
+        "제품설명회 시행 결과보고서": "제품설명회 시행 결과보고서(템플릿형).docx"
+    }
+    
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         CreateDocumentAgent 초기화
         
         Args:
             model_name: 기본 LLM 모델명
             temperature: LLM 온도 설정
+            semantic_cache: 문서 타입 분류 결과 캐시
+                (None이면 DOC_TYPE_SEMANTIC_CACHE=1일 때만 프로세스 공용 캐시 사용)
         """
         self.model_name = model_name
         self.temperature = temperature
@@ -61,16 +101,36 @@ class CreateDocumentAgent:
         # LLM 초기화
         self.llm = ChatOpenAI(
             model=self.model_name, 
-            temperature=self.temperature
+            temperature=self.temperature,
+            http_client=get_http_client()  # 에이전트 간 연결 풀 공유
         )
+        # 파싱용 LLM: 모든 필드를 JSON 객체 하나로 받도록 응답 형식을 강제
+        self.json_llm = self.llm.bind(response_format={"type": "json_object"})
+        
+        # YAML 파일에서 템플릿 로드 (프로세스당 1회, 모든 인스턴스가 공유)
+        self._load_templates()
         
-        # YAML 파일에서 템플릿 로드
-        self.doc_prompts = self._load_templates()
+        # 유사한 요청의 문서 타입 분류 결과 재사용 (LLM 분류 호출 생략)
+        self.semantic_cache = semantic_cache if semantic_cache is not None else self._default_semantic_cache()
         
         # 그래프 초기화
         self.app = self._build_graph()
     
-    def _load_templates(self):
+    @property
+    def doc_prompts(self) -> dict:
+        """문서 타입별 템플릿 정보 (클래스 단위로 공유되므로 수정하지 말 것)"""
+        return self._load_templates()
+    
+    @staticmethod
+    def _default_semantic_cache() -> Optional[SemanticCache]:
+        """DOC_TYPE_SEMANTIC_CACHE가 켜진 경우에만 공용 의미 기반 캐시 반환 (기본 비활성화)"""
+        if os.getenv("DOC_TYPE_SEMANTIC_CACHE", "").lower() not in ("1", "true", "yes"):
+            return None
+        return _shared_doc_type_cache()
+    
+    @classmethod
+    @functools.cache
+    def _load_templates(cls):
         """
         YAML 파일에서 문서 템플릿 및 프롬프트 정보를 로드합니다.
         
@@ -99,7 +159,9 @@ class CreateDocumentAgent:
             # YAML 파일 읽기 및 파싱
             with open(template_path, 'r', encoding='utf-8') as file:
                 data = yaml.safe_load(file)
-                return data.get('templates', {})
+            templates = data.get('templates', {})
+            
+            return templates
                 
         except Exception as e:
             print(f"[ERROR] 템플릿 로드 중 오류 발생: {e}")
@@ -148,8 +210,24 @@ class CreateDocumentAgent:
             else:
                 classification_input = user_message  # 문서 타입이 분리되지 않았으면 전체 메시지 사용
             
-            classification_prompt = ChatPromptTemplate.from_messages([
-                ("system", """
+            # 의미적으로 유사한 이전 요청이 있으면 분류 결과 재사용 (캐시 사용 시)
+            embedding = None
+            cache_hit = None
+            if self.semantic_cache is not None:
+                embedding = self.semantic_cache.embed(classification_input)
+                cache_hit = self.semantic_cache.lookup(classification_input, embedding=embedding)
+            if cache_hit and not all(
+                keyword in classification_input for keyword in _DOC_TYPE_CACHE_KEYWORDS.get(cache_hit.value, ())
+            ):
+                print(f"[CACHE] 문서 타입 키워드 불일치로 캐시 무시: '{cache_hit.text}' → {cache_hit.value}")
+                cache_hit = None
+            
+            if cache_hit:
+                doc_type = cache_hit.value
+                print(f"[CACHE] 문서 타입 캐시 적중: '{cache_hit.text}' (유사도: {cache_hit.similarity:.3f})")
+            else:
+                classification_prompt = ChatPromptTemplate.from_messages([
+                    ("system", """
 사용자의 요청을 분석하여 다음 문서 타입 중 하나로 분류해주세요:
 1. 영업방문 결과보고서 - 고객 방문, 영업 활동 관련
 2. 제품설명회 시행 신청서 - 제품설명회 진행 계획, 신청 관련
@@ -157,20 +235,25 @@ class CreateDocumentAgent:
 
 반드시 위 3가지 중 하나의 정확한 문서 타입 이름만 응답해주세요.
 앞에 숫자는 제거하고 문서명만 출력하세요.
-                """),
-                ("human", "{user_request}")
-            ])
+                    """),
+                    ("human", "{user_request}")
+                ])
             
-            # LLM을 통한 문서 타입 분류 실행
-            response = self.llm.invoke(classification_prompt.format_messages(user_request=classification_input))
-            content = response.content
+                # LLM을 통한 문서 타입 분류 실행
+                LLM_RATE_LIMIT.wait()
+                response = self.llm.invoke(classification_prompt.format_messages(user_request=classification_input))
+                content = response.content
             
-            # 응답 내용을 문자열로 정규화
-            if isinstance(content, str):
-                doc_type = content.strip()
-            else:
-                doc_type = str(content).strip()
+                # 응답 내용을 문자열로 정규화
+                if isinstance(content, str):
+                    doc_type = content.strip()
+                else:
+                    doc_type = str(content).strip()
                 
+                # 지원 문서 타입으로 분류된 경우에만 캐시에 저장
+                if self.semantic_cache is not None and doc_type in self.doc_prompts:
+                    self.semantic_cache.insert(classification_input, doc_type, embedding=embedding)
+            
             # 분류 결과를 상태에 저장
             state["doc_type"] = doc_type
             print(f"[CLASSIFY] LLM 문서 타입 분류: {doc_type}")
@@ -334,6 +417,7 @@ class CreateDocumentAgent:
         
         try:
             # LLM을 통한 응답 분석 실행
+            LLM_RATE_LIMIT.wait()
             response = self.llm.invoke(verification_prompt.format_messages(user_response=user_response))
             content = response.content.strip()
             
@@ -539,7 +623,9 @@ class CreateDocumentAgent:
             for m in formatted_messages:
                 print(f"[{m.type.upper()}] {m.content[:200]}...")
 
-            response = self.llm.invoke(formatted_messages)
+            # 템플릿의 전체 필드를 한 번의 호출로 JSON 객체로 받음 (형식 오류로 인한 재시도 방지)
+            LLM_RATE_LIMIT.wait()
+            response = self.json_llm.invoke(formatted_messages)
 
             content = response.content
             json_str = content if isinstance(content, str) else str(content)
@@ -577,7 +663,7 @@ class CreateDocumentAgent:
 
             if retry_count >= 3:
                 print("[WARNING] 파싱 재시도 초과. 기본값 사용.")
-                fallback_data = self.doc_prompts[doc_type]["choan_fallback_fields"]
+                fallback_data = copy.deepcopy(self.doc_prompts[doc_type]["choan_fallback_fields"])
                 state["filled_data"] = fallback_data
             else:
                 print(f"[RETRY] 재시도 {retry_count}/3")
@@ -683,16 +769,16 @@ class CreateDocumentAgent:
             # "OK"가 포함된 항목은 제외
             if item and "OK" not in item and item != "규정 검색 실패" and "오류" not in item:
                 # 문구와 위반 내용을 분리
-                if ":" in item:
-                    phrase, violation_detail = item.split(":", 1)
-                    phrase = phrase.strip()
-                    violation_detail = violation_detail.strip()
+                match = _VIOLATION_ITEM_RE.match(item)
+                if match:
+                    phrase = match.group(1).strip()
+                    violation_detail = match.group(2).strip()
                     
                     # 실제 위반 내용이 있는 경우만 추가
                     if violation_detail and violation_detail != "OK":
                         violations.append(f"'{phrase}' - {violation_detail}")
                 else:
-                    # ":"가 없는 경우 전체를 위반 내용으로 처리
+                    # 콜론이 없는 경우 전체를 위반 내용으로 처리
                     violations.append(item)
         
         return violations
@@ -718,9 +804,9 @@ class CreateDocumentAgent:
         if violation_text.strip().endswith('"OK"') or violation_text.strip().endswith("'OK'"):
             return False
             
-        # 줄 끝에 "OK"가 따로 있는 경우
-        lines = violation_text.strip().split('\n')
-        if lines and lines[-1].strip() == '"OK"':
+        # 줄 끝에 "OK"가 따로 있는 경우 (마지막 줄만 확인)
+        last_line = violation_text.strip().rsplit('\n', 1)[-1]
+        if last_line.strip() == '"OK"':
             return False
             
         # 전체 내용에서 실제 위반 항목이 있는지 검사
@@ -728,6 +814,34 @@ class CreateDocumentAgent:
         
         return len(actual_violations) > 0
 
+    def _prefetch_docx_templates(self):
+        """
+        분류 LLM 호출 중에 docx 템플릿 파일 읽기를 백그라운드에서 시작합니다.
+        프로세스당 1회만 읽으며, 이전 읽기가 실패했으면 다시 시도합니다.
+        """
+        global _docx_templates_future
+        with _docx_templates_lock:
+            future = _docx_templates_future
+            if future is None or (future.done() and future.exception() is not None):
+                future = _TEMPLATE_EXECUTOR.submit(self._read_docx_templates)
+                _docx_templates_future = future
+        return future
+    
+    def _read_docx_templates(self) -> dict:
+        """
+        S3 폴더의 docx 템플릿 파일을 모두 읽습니다.
+        
+        Returns:
+            dict: 문서 타입별 템플릿 파일 바이트 (파일이 없는 타입은 제외)
+        """
+        template_dir = Path(__file__).parent / "S3"
+        templates = {}
+        for doc_type, filename in self.DOCX_TEMPLATES.items():
+            template_path = template_dir / filename
+            if template_path.exists():
+                templates[doc_type] = template_path.read_bytes()
+        return templates
+    
     def create_choan_document(self, state: State) -> State:
         """
         파싱된 데이터를 기반으로 초안 문서를 생성하고 docx 파일로 저장합니다.
@@ -741,13 +855,7 @@ class CreateDocumentAgent:
         doc_type = state["doc_type"]
         filled_data = state["filled_data"]
         
-        # 문서 타입에 따른 템플릿 파일 매핑
-        template_mapping = {
-            "영업방문 결과보고서": "영업방문 결과보고서(템플릿형).docx",
-            "제품설명회 시행 신청서": "제품설명회 시행 신청서(템플릿형).docx",
-            "제품설명회 시행 결과보고서": "제품설명회 시행 결과보고서(템플릿형).docx"
-        }
-        template_filename = template_mapping.get(doc_type)
+        template_filename = self.DOCX_TEMPLATES.get(doc_type)
         if not template_filename:
             print(f"[ERROR] 지원하지 않는 문서 타입: {doc_type}")
             state["final_doc"] = None
@@ -757,7 +865,13 @@ class CreateDocumentAgent:
         current_dir = Path(__file__).parent
         template_path = current_dir / "S3" / template_filename
         
-        if not template_path.exists():
+        try:
+            template_bytes = self._prefetch_docx_templates().result().get(doc_type)
+        except Exception as e:
+            print(f"[WARNING] 템플릿 미리 읽기 실패: {e}")
+            template_bytes = template_path.read_bytes() if template_path.exists() else None
+        
+        if template_bytes is None:
             print(f"[ERROR] 템플릿 파일을 찾을 수 없습니다: {template_path}")
             state["final_doc"] = None
             return state
@@ -765,7 +879,7 @@ class CreateDocumentAgent:
         try:
             # 템플릿 파일 읽기
             print(f"[TEMPLATE] 템플릿 파일 로딩: {template_filename}")
-            doc = Document(str(template_path))
+            doc = Document(io.BytesIO(template_bytes))
             
             print(f"[INFO] 템플릿 플레이스홀더 치환 중...")
             
@@ -1286,32 +1400,15 @@ class CreateDocumentAgent:
             print("=" * 60)
         
         # 초기 상태 설정
-        initial_state = {
-            "messages": [HumanMessage(content=user_input)],
-            "doc_type": None,
-            "template_content": None,
-            "filled_data": None,
-            "violation": None,
-            "final_doc": None,
-            "retry_count": 0,
-            "restart_classification": None,
-            "classification_retry_count": None,
-            "classification_failed": None,
-            "skip_verification": None,
-            "end_process": None,
-            "parse_retry_count": None,
-            "parse_failed": None,
-            "user_reply": None,
-            "verification_reply": None,
-            "verification_result": None,
-            "user_content": None,
-            "skip_ask_fields": None
-        }
+        initial_state = self._create_initial_state(user_input)
         
         # 고유한 스레드 ID 생성
         thread_id = str(uuid.uuid4())
         config = {"configurable": {"thread_id": thread_id}}
         
+        # 분류 LLM 호출과 겹치도록 docx 템플릿 읽기를 먼저 시작
+        self._prefetch_docx_templates()
+        
         try:
             # 그래프 실행 (인터럽트 발생 시 중단)
             result = self.app.invoke(initial_state, config)
@@ -1339,6 +1436,30 @@ class CreateDocumentAgent:
             print(f"\n[ERROR] 실행 중 오류: {e}")
             return {"success": False, "error": str(e)}
     
+    def _create_initial_state(self, user_input: str) -> State:
+        """문서 작성 그래프 초기 상태 생성"""
+        return {
+            "messages": [HumanMessage(content=user_input)],
+            "doc_type": None,
+            "template_content": None,
+            "filled_data": None,
+            "violation": None,
+            "final_doc": None,
+            "retry_count": 0,
+            "restart_classification": None,
+            "classification_retry_count": None,
+            "classification_failed": None,
+            "skip_verification": None,
+            "end_process": None,
+            "parse_retry_count": None,
+            "parse_failed": None,
+            "user_reply": None,
+            "verification_reply": None,
+            "verification_result": None,
+            "user_content": None,
+            "skip_ask_fields": None
+        }
+    
     def _handle_interactive_mode(self, thread_id: str):
         """
         인터럽트 발생 시 대화형 모드 처리
@@ -1413,15 +1534,7 @@ class CreateDocumentAgent:
             current_state = self.app.get_state(config)
             print(f"[STATE] 현재 상태: {current_state}")
             
-            # 사용자 입력을 상태에 업데이트 (입력 타입에 따라)
-            update_data = {input_type: user_reply}
-            self.app.update_state(config, update_data)
-            
-            # 사용자 입력을 메시지 히스토리에도 추가
-            new_message = HumanMessage(content=user_reply)
-            current_messages = current_state.values.get("messages", [])
-            current_messages.append(new_message)
-            self.app.update_state(config, {"messages": current_messages})
+            self._apply_user_reply(config, current_state, user_reply, input_type)
             
             # 워크플로우 재개 - stream을 사용하여 단계별로 진행
             final_result = None
@@ -1462,8 +1575,63 @@ class CreateDocumentAgent:
             import traceback
             traceback.print_exc()
             return {"success": False, "error": str(e)}
+    
+    def _apply_user_reply(self, config: dict, current_state, user_reply: str, input_type: str):
+        """사용자 입력을 입력 타입에 맞는 필드와 메시지 히스토리에 반영"""
+        # 사용자 입력을 상태에 업데이트 (입력 타입에 따라)
+        update_data = {input_type: user_reply}
+        self.app.update_state(config, update_data)
+        
+        # 사용자 입력을 메시지 히스토리에도 추가
+        new_message = HumanMessage(content=user_reply)
+        current_messages = current_state.values.get("messages", [])
+        current_messages.append(new_message)
+        self.app.update_state(config, {"messages": current_messages})
+    
+    async def astream(self, user_input: str, thread_id: str) -> AsyncIterator[str]:
+        """
+        문서 작성 워크플로우를 시작하고 LLM 출력을 생성되는 대로 전달합니다.
+        run과 달리 인터럽트에서 대화형 입력을 받지 않고 종료하며, 이후 astream_resume으로 이어갑니다.
+        
+        Args:
+            user_input (str): 사용자 입력
+            thread_id (str): 스레드 ID (astream_resume에서 같은 값 사용)
+        
+        Yields:
+            str: LLM 응답 토큰
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        self._prefetch_docx_templates()
+        
+        async for chunk in self._astream_tokens(self._create_initial_state(user_input), config):
+            yield chunk
+    
+    async def astream_resume(self, thread_id: str, user_reply: str, input_type: str = "user_reply") -> AsyncIterator[str]:
+        """
+        resume의 스트리밍 버전 - 인터럽트된 워크플로우를 재개하고 LLM 출력을 생성되는 대로 전달합니다.
+        결과(violation, final_doc 등)는 종료 후 self.app.get_state로 확인합니다.
+        
+        Args:
+            thread_id (str): 스레드 ID
+            user_reply (str): 사용자 입력
+            input_type (str): 입력 타입 ("user_reply", "verification_reply")
+        
+        Yields:
+            str: LLM 응답 토큰
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        self._apply_user_reply(config, self.app.get_state(config), user_reply, input_type)
+        
+        async for chunk in self._astream_tokens(None, config):
+            yield chunk
+    
+    async def _astream_tokens(self, graph_input, config: dict) -> AsyncIterator[str]:
+        """그래프를 비동기 스트리밍 모드로 실행하여 LLM 토큰 텍스트만 전달"""
+        async for message_chunk, _metadata in self.app.astream(graph_input, config, stream_mode="messages"):
+            if isinstance(message_chunk.content, str) and message_chunk.content:
+                yield message_chunk.content
 
 if __name__ == "__main__":
-    # 통합 문서 작성 시스템 실행
+    # 통합 문서 작성 시스템 실행 (backend 디렉토리에서 python -m app.services.docs_agent.create_document_agent)
     agent = CreateDocumentAgent()
     agent.run(user_input="영업방문결과보고서 작성해줘 방문 제목은 유미가정의학과 신약 홍보이고 방문일은 250725이고 client는 유미가정의학과 방문사이트는 www.yumibanplz.com 담담자는 손현성이고 소속은 영업팀 연락처는  010-1234-5678이야 영업제공자는  김도윤이고 연락처는 010-8765-4321이야 방문자는 허한결이고 소속은 영업팀이야 고객사 개요는 이번에 새로 오픈한 가정의학과로 사용 약품에 대해 많은 논의가 필요해보이는 잠재력이 있는 고객이야 프로젝트 개요는 신규고객 유치로 자사 납품 약품 안내 및 장점 소개야 방문 및 협의 내용은 자사 취급 약품 소개 및 약품별 효능 소개하였음 향후계획및일정은 7월 27일에 다시 방문하여 자사 판촉물 전달(1만원 이하)과 공급 약품 가격 협상을 할 예정이야 협조사항으로 다음 방문일 전까지 고객에게 전달할 자사 판촉물(1만원 이하) 1개 요청")
\ No newline at end of file
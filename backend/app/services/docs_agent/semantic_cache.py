@@ -0,0 +1,285 @@
+"""
+의미 기반(semantic) 캐시 모듈
+문장 임베딩이 충분히 유사한 이전 요청의 결과를 재사용하여 LLM 호출을 줄입니다.
+
+- 임베딩: sentence-transformers (한국어 지원 모델)
+- 최근접 검색: faiss IndexFlatIP (미설치 시 numpy 내적으로 대체)
+- 저장소: SQLite (프로세스 재시작 후에도 유지, 기본 위치는 사용자 캐시 디렉토리)
+- 만료: 저장 후 ttl_seconds가 지난 항목은 적중으로 보지 않고 다음 로드 시 삭제
+
+sentence-transformers가 설치되어 있지 않으면 캐시는 비활성화되며,
+lookup은 항상 None을 반환하고 insert는 아무 작업도 하지 않습니다.
+"""
+from typing import Optional, NamedTuple
+from pathlib import Path
+from datetime import datetime, timedelta
+import sqlite3
+import os
+import threading
+
+import numpy as np
+
+
+class CacheHit(NamedTuple):
+    """캐시 조회 결과"""
+    value: str
+    similarity: float
+    text: str
+
+
+# 모델명별 SentenceTransformer (여러 캐시 인스턴스가 같은 모델을 중복 로드하지 않도록 공유)
+_models = {}
+_models_lock = threading.Lock()
+
+
+def _shared_model(model_name: str):
+    """모델명별 SentenceTransformer를 프로세스에서 한 번만 로드하여 반환합니다."""
+    from sentence_transformers import SentenceTransformer
+
+    with _models_lock:
+        if model_name not in _models:
+            _models[model_name] = SentenceTransformer(model_name)
+        return _models[model_name]
+
+
+def _default_db_path() -> Path:
+    """
+    기본 SQLite 파일 경로 (소스 트리 밖의 사용자 캐시 디렉토리)
+    SEMANTIC_CACHE_DIR 환경 변수가 있으면 그 디렉토리를 사용합니다.
+    """
+    cache_dir = os.getenv("SEMANTIC_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir) / "semantic_cache.db"
+    base_dir = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base_dir) / "router_agent" / "semantic_cache.db"
+
+
+class SemanticCache:
+    """
+    문장 임베딩 최근접 검색 기반 캐시
+    """
+
+    DEFAULT_MODEL = "jhgan/ko-sroberta-multitask"
+    DEFAULT_TTL_SECONDS = 24 * 3600
+
+    def __init__(
+        self,
+        namespace: str = "default",
+        db_path: Optional[str] = None,
+        model_name: str = DEFAULT_MODEL,
+        threshold: float = 0.92,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS
+    ):
+        """
+        SemanticCache 초기화
+
+        Args:
+            namespace: 캐시 구분자 (같은 DB 파일을 여러 용도로 공유할 때 사용)
+            db_path: SQLite 파일 경로 (None이면 사용자 캐시 디렉토리의 semantic_cache.db)
+            model_name: sentence-transformers 모델명
+            threshold: 캐시 적중으로 판단할 코사인 유사도 하한
+            ttl_seconds: 항목 유효 기간(초), None이면 만료 없음
+        """
+        self.namespace = namespace
+        self.db_path = Path(db_path) if db_path else _default_db_path()
+        self.model_name = model_name
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._model = None
+        self._enabled = None  # 최초 사용 시 의존성 확인
+        self._conn = None
+        self._index = None
+        self._matrix = None  # faiss 미설치 시 사용하는 (N, dim) 임베딩 행렬
+        self._entries = []   # 인덱스 순서와 동일한 (text, value, created_at) 목록
+        self._positions = {}  # 원문 → _entries 위치 (중복 저장 방지 및 만료 항목 갱신용)
+
+    # ------------------------------------------------------------------
+    # 초기화 (지연 로딩)
+    # ------------------------------------------------------------------
+
+    def _ensure_ready(self) -> bool:
+        """임베딩 모델, 인덱스, DB를 최초 사용 시점에 준비합니다."""
+        if self._enabled is not None:
+            return self._enabled
+
+        with self._init_lock:
+            if self._enabled is None:
+                self._enabled = self._initialize()
+        return self._enabled
+
+    def _initialize(self) -> bool:
+        """의존성 확인 후 모델을 로드하고 SQLite 저장 항목으로 인덱스를 구성합니다."""
+        try:
+            import sentence_transformers  # noqa: F401
+        except ImportError:
+            print("[WARNING] sentence-transformers 미설치 - 의미 기반 캐시를 사용하지 않습니다.")
+            return False
+
+        try:
+            self._model = _shared_model(self.model_name)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    namespace TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (namespace, text)
+                )
+                """
+            )
+            self._conn.commit()
+            self._load_entries()
+            print(f"[CACHE] 의미 기반 캐시 로드 완료 ({self.namespace}): {len(self._entries)}건")
+            return True
+        except Exception as e:
+            print(f"[WARNING] 의미 기반 캐시 초기화 실패: {e}")
+            return False
+
+    def _load_entries(self):
+        """만료된 항목을 삭제하고 SQLite에 남은 항목으로 검색 인덱스를 구성합니다."""
+        if self.ttl_seconds is not None:
+            cutoff = datetime.now() - timedelta(seconds=self.ttl_seconds)
+            self._conn.execute(
+                "DELETE FROM semantic_cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, cutoff.isoformat())
+            )
+            self._conn.commit()
+
+        rows = self._conn.execute(
+            "SELECT text, embedding, value, created_at FROM semantic_cache WHERE namespace = ? ORDER BY created_at",
+            (self.namespace,)
+        ).fetchall()
+
+        dim = self._model.get_sentence_embedding_dimension()
+        embeddings = np.zeros((len(rows), dim), dtype=np.float32)
+        for i, (text, blob, value, created_at) in enumerate(rows):
+            embeddings[i] = np.frombuffer(blob, dtype=np.float32)
+            self._positions[text] = len(self._entries)
+            self._entries.append((text, value, datetime.fromisoformat(created_at)))
+
+        try:
+            import faiss
+            self._index = faiss.IndexFlatIP(dim)
+            if len(rows):
+                self._index.add(embeddings)
+        except ImportError:
+            self._matrix = embeddings
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        문장을 정규화된 float32 임베딩으로 변환합니다.
+
+        Returns:
+            np.ndarray: (dim,) 임베딩, 캐시 비활성화 시 None
+        """
+        if not self._ensure_ready():
+            return None
+
+        embedding = self._model.encode([text], normalize_embeddings=True)[0]
+        return np.asarray(embedding, dtype=np.float32)
+
+    def lookup(
+        self,
+        text: str,
+        threshold: Optional[float] = None,
+        embedding: Optional[np.ndarray] = None
+    ) -> Optional[CacheHit]:
+        """
+        가장 유사한 저장 항목을 찾아 유사도가 임계값 이상이면 반환합니다.
+
+        Args:
+            text: 조회할 문장
+            threshold: 코사인 유사도 하한 (None이면 생성 시 설정값)
+            embedding: 미리 계산한 임베딩 (없으면 새로 계산)
+
+        Returns:
+            CacheHit: 적중 시 (값, 유사도, 저장된 원문), 미적중 시 None
+        """
+        if embedding is None:
+            embedding = self.embed(text)
+        if embedding is None:
+            return None
+
+        threshold = self.threshold if threshold is None else threshold
+
+        with self._lock:
+            if not self._entries:
+                return None
+
+            if self._index is not None:
+                scores, indices = self._index.search(embedding[np.newaxis, :], 1)
+                best_score, best_index = float(scores[0][0]), int(indices[0][0])
+            else:
+                scores = self._matrix @ embedding
+                best_index = int(np.argmax(scores))
+                best_score = float(scores[best_index])
+
+            if best_score < threshold:
+                return None
+
+            cached_text, value, created_at = self._entries[best_index]
+            if self._is_expired(created_at):
+                return None
+
+        return CacheHit(value=value, similarity=best_score, text=cached_text)
+
+    def insert(self, text: str, value: str, embedding: Optional[np.ndarray] = None):
+        """
+        문장과 결과를 캐시에 저장합니다. 같은 문장이 이미 있으면 무시하고, 만료된 경우에는 값을 갱신합니다.
+
+        Args:
+            text: 원문
+            value: 저장할 결과 값
+            embedding: 미리 계산한 임베딩 (없으면 새로 계산)
+        """
+        if embedding is None:
+            embedding = self.embed(text)
+        if embedding is None:
+            return
+
+        embedding = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            position = self._positions.get(text)
+            if position is not None and not self._is_expired(self._entries[position][2]):
+                return
+
+            created_at = datetime.now()
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO semantic_cache (namespace, text, embedding, value, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, text, embedding.tobytes(), value, created_at.isoformat())
+                )
+                self._conn.commit()
+            except Exception as e:
+                print(f"[WARNING] 의미 기반 캐시 저장 실패: {e}")
+                return
+
+            # 같은 원문은 임베딩도 같으므로 인덱스는 그대로 두고 값만 교체
+            if position is not None:
+                self._entries[position] = (text, value, created_at)
+                return
+
+            if self._index is not None:
+                self._index.add(embedding[np.newaxis, :])
+            else:
+                self._matrix = np.vstack([self._matrix, embedding[np.newaxis, :]])
+            self._positions[text] = len(self._entries)
+            self._entries.append((text, value, created_at))
+
+    def _is_expired(self, created_at: datetime) -> bool:
+        """저장 시각 기준으로 유효 기간이 지났는지 확인"""
+        if self.ttl_seconds is None:
+            return False
+        return (datetime.now() - created_at).total_seconds() > self.ttl_seconds
@@ -2,27 +2,119 @@
 질문 분류기 모듈
 사용자의 질문을 분석하여 적절한 에이전트로 라우팅합니다.
 """
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
+from collections import OrderedDict
+import threading
+import functools
+import hashlib
+import copy
 import json
+import os
 import re
 
+from .._http import get_http_client
+from .._rate_limit import LLM_RATE_LIMIT
+from ..docs_agent.semantic_cache import SemanticCache
+
+
+# LLM 호출 없이 바로 결정할 수 있는 명확한 키워드 (한쪽만 2개 이상 포함된 경우)
+_DOCS_FAST_KEYWORDS = frozenset({
+    "보고서", "신청서", "템플릿", "양식", "결과서", "영업방문", "제품설명회", "작성"
+})
+_EMPLOYEE_FAST_KEYWORDS = frozenset({
+    "실적", "매출", "직원", "성과", "트렌드", "달성률", "kpi"
+})
+
+
+# 분류 결과 캐시 설정 (프로세스 내 LRU + 선택적 Redis / 의미 기반 캐시)
+_CACHE_MAXSIZE = 1024
+_CACHE_TTL_SECONDS = 3600  # Redis와 의미 기반 캐시 항목의 유효 기간
+_REDIS_KEY_PREFIX = "agent_classifier:"
+
+# 표현만 조금 다른 질문을 같은 질문으로 볼 코사인 유사도 하한
+_SEMANTIC_THRESHOLD = 0.95
+
+# 한 번의 LLM 호출로 분류할 최대 질문 수 (많을수록 중간 질문의 정확도가 떨어짐)
+_MAX_QUERIES_PER_BATCH = 4
+
+
+def _normalize_query(query: str) -> str:
+    """캐시 키용 질문 정규화 (소문자, 연속 공백 하나로)"""
+    return " ".join(query.split()).lower()
+
+
+def _llm_failure(reasoning: str) -> Dict[str, Any]:
+    """
+    LLM 호출/응답 해석 실패 시의 분류 결과
+    일시적인 오류일 수 있으므로 cacheable=False로 표시하여 캐시에 남기지 않습니다.
+    """
+    return {
+        "agent": None,
+        "confidence": 0.0,
+        "reasoning": reasoning,
+        "extracted_intent": "",
+        "key_entities": [],
+        "cacheable": False
+    }
+
+
+def _connect_redis():
+    """
+    CLASSIFIER_REDIS_URL이 설정된 경우 Redis 클라이언트를 반환합니다.
+    미설정, redis 패키지 미설치, 연결 실패 시 None (프로세스 내 캐시만 사용)
+    """
+    url = os.getenv("CLASSIFIER_REDIS_URL")
+    if not url:
+        return None
+    
+    try:
+        import redis
+        client = redis.Redis.from_url(url, socket_timeout=1)
+        client.ping()
+        return client
+    except Exception as e:
+        print(f"[WARNING] 분류 결과 Redis 캐시 연결 실패 - 프로세스 내 캐시만 사용: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_semantic_cache() -> SemanticCache:
+    """분류기 공용 의미 기반 캐시 (문서 타입 캐시와 같은 DB, 별도 namespace)"""
+    return SemanticCache(
+        namespace="agent_classifier",
+        threshold=_SEMANTIC_THRESHOLD,
+        ttl_seconds=_CACHE_TTL_SECONDS
+    )
+
 
 class AgentClassifier:
     """
     사용자 질문을 분석하여 적절한 에이전트를 선택하는 분류기
     """
     
-    def __init__(self, model_name: str = "gpt-4o-mini", temperature: float = 0.1):
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        temperature: float = 0.1,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         분류기 초기화
         
         Args:
             model_name: 사용할 LLM 모델명
             temperature: LLM 온도 설정 (낮을수록 일관성 높음)
+            semantic_cache: 유사 질문 분류 결과 캐시
+                (None이면 CLASSIFIER_SEMANTIC_CACHE=1일 때만 프로세스 공용 캐시 사용)
         """
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature)
+        self.model_name = model_name
+        self.temperature = temperature
+        self.llm = ChatOpenAI(model=model_name, temperature=temperature, http_client=get_http_client())
+        
+        # 표현만 다른 유사 질문의 분류 결과 재사용 (LLM 분류 호출 생략)
+        self.semantic_cache = semantic_cache if semantic_cache is not None else self._default_semantic_cache()
         
         # 에이전트별 키워드 및 패턴 정의
         self.agent_patterns = {
@@ -55,9 +147,113 @@ class AgentClassifier:
             }
         }
         
+        # 패턴은 생성 시 한 번만 컴파일
+        self._compiled_patterns = {
+            agent: [re.compile(pattern) for pattern in config["patterns"]]
+            for agent, config in self.agent_patterns.items()
+        }
+        
+        # 동일(정규화 기준) 질문 반복 시 LLM 호출을 생략하기 위한 캐시
+        self._init_cache()
+    
+    def _init_cache(self):
+        """분류 결과 캐시 초기화"""
+        self._cache: "OrderedDict[str, Tuple[str, float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._redis = _connect_redis()
+    
+    @staticmethod
+    def _default_semantic_cache() -> Optional[SemanticCache]:
+        """CLASSIFIER_SEMANTIC_CACHE가 켜진 경우에만 공용 의미 기반 캐시 반환 (기본 비활성화)"""
+        if os.getenv("CLASSIFIER_SEMANTIC_CACHE", "").lower() not in ("1", "true", "yes"):
+            return None
+        return _shared_semantic_cache()
+    
+    def _semantic_lookup(self, user_query: str):
+        """
+        유사한 이전 질문의 분류 결과 조회
+        
+        Returns:
+            Tuple: (적중 시 분류 결과 또는 None, 저장 시 재사용할 임베딩)
+        """
+        if self.semantic_cache is None:
+            return None, None
+        
+        embedding = self.semantic_cache.embed(user_query)
+        cache_hit = self.semantic_cache.lookup(user_query, embedding=embedding)
+        if cache_hit is None:
+            return None, embedding
+        
+        agent, confidence, analysis = json.loads(cache_hit.value)
+        analysis["original_query"] = user_query
+        analysis["semantic_cache"] = {"similarity": cache_hit.similarity, "matched_query": cache_hit.text}
+        print(f"[CACHE] 유사 질문 분류 결과 재사용 (유사도 {cache_hit.similarity:.3f}): {cache_hit.text[:30]}")
+        return (agent, confidence, analysis), embedding
+    
+    def _semantic_insert(self, user_query: str, result: Tuple[str, float, Dict[str, Any]], embedding):
+        """LLM으로 분류한 결과를 의미 기반 캐시에 저장"""
+        if self.semantic_cache is None:
+            return
+        self.semantic_cache.insert(user_query, json.dumps(result, ensure_ascii=False), embedding=embedding)
+    
+    def _cache_get(self, key: str) -> Optional[Tuple[str, float, Dict[str, Any]]]:
+        """프로세스 내 캐시 → Redis 순으로 조회"""
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        if self._redis is None:
+            return None
+        
+        try:
+            raw = self._redis.get(_REDIS_KEY_PREFIX + hashlib.sha256(key.encode("utf-8")).hexdigest())
+        except Exception as e:
+            print(f"[WARNING] Redis 캐시 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+        
+        agent, confidence, analysis = json.loads(raw)
+        result = (agent, confidence, analysis)
+        self._cache_put_local(key, result)
+        return result
+    
+    def _cache_set(self, key: str, result: Tuple[str, float, Dict[str, Any]]):
+        """프로세스 내 캐시와 Redis에 저장"""
+        result = copy.deepcopy(result)
+        self._cache_put_local(key, result)
+        
+        if self._redis is None:
+            return
+        
+        try:
+            self._redis.setex(
+                _REDIS_KEY_PREFIX + hashlib.sha256(key.encode("utf-8")).hexdigest(),
+                _CACHE_TTL_SECONDS,
+                json.dumps(result, ensure_ascii=False)
+            )
+        except Exception as e:
+            print(f"[WARNING] Redis 캐시 저장 실패: {e}")
+    
+    def _cache_put_local(self, key: str, result: Tuple[str, float, Dict[str, Any]]):
+        """프로세스 내 LRU 캐시에 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+    
+    def _from_cache(self, user_query: str, cached: Tuple[str, float, Dict[str, Any]]) -> Tuple[str, float, Dict[str, Any]]:
+        """캐시된 결과의 사본에 현재 질문 원문을 반영하여 반환"""
+        agent, confidence, analysis = copy.deepcopy(cached)
+        analysis["original_query"] = user_query
+        return agent, confidence, analysis
+        
     def classify(self, user_query: str) -> Tuple[str, float, Dict[str, Any]]:
         """
         사용자 질문을 분류하여 적절한 에이전트를 선택합니다.
+        대소문자/공백만 다른 동일 질문은 캐시된 결과의 사본을 반환합니다.
         
         Args:
             user_query: 사용자 입력 질문
@@ -65,18 +261,133 @@ class AgentClassifier:
         Returns:
             Tuple[str, float, Dict]: (선택된 에이전트, 신뢰도, 분석 정보)
         """
-        # 1단계: 키워드 기반 빠른 분류 시도
-        keyword_result = self._keyword_classification(user_query)
+        result, embedding = self._resolve_without_llm(user_query)
+        if result is not None:
+            return result
         
-        # 2단계: LLM을 통한 정밀 분류
         llm_result = self._llm_classification(user_query)
+        return self._finish_classification(user_query, llm_result, embedding)
+    
+    async def aclassify(self, user_query: str) -> Tuple[str, float, Dict[str, Any]]:
+        """
+        classify의 비동기 버전
+        캐시에 있는 질문은 즉시 반환하고, 없으면 LLM 호출을 await하여 다른 요청과 대기 시간을 겹칩니다.
         
-        # 3단계: 결과 통합 및 최종 결정
-        final_agent, confidence, analysis = self._combine_results(
-            keyword_result, llm_result, user_query
-        )
+        Args:
+            user_query: 사용자 입력 질문
+            
+        Returns:
+            Tuple[str, float, Dict]: (선택된 에이전트, 신뢰도, 분석 정보)
+        """
+        result, embedding = self._resolve_without_llm(user_query)
+        if result is not None:
+            return result
+        
+        llm_result = await self._allm_classification(user_query)
+        return self._finish_classification(user_query, llm_result, embedding)
+    
+    def classify_batch(self, queries: List[str]) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        여러 질문을 묶어서 분류합니다.
+        캐시/키워드로 결정되지 않은 질문만 최대 _MAX_QUERIES_PER_BATCH개씩 하나의 프롬프트로 LLM에 요청하여
+        시스템 프롬프트 비용을 질문 간에 나눕니다. 응답 파싱에 실패한 묶음은 질문별로 다시 분류합니다.
+        
+        Args:
+            queries: 사용자 질문 목록
+            
+        Returns:
+            List[Tuple[str, float, Dict]]: 입력 순서와 같은 (선택된 에이전트, 신뢰도, 분석 정보) 목록
+        """
+        results: List[Optional[Tuple[str, float, Dict[str, Any]]]] = [None] * len(queries)
+        pending: List[int] = []
+        embeddings: Dict[int, Any] = {}
+        
+        for i, query in enumerate(queries):
+            results[i], embeddings[i] = self._resolve_without_llm(query)
+            if results[i] is None:
+                pending.append(i)
+        
+        for start in range(0, len(pending), _MAX_QUERIES_PER_BATCH):
+            chunk = pending[start:start + _MAX_QUERIES_PER_BATCH]
+            llm_results = self._llm_batch_classification([queries[i] for i in chunk])
+            
+            for i, llm_result in zip(chunk, llm_results):
+                results[i] = self._finish_classification(queries[i], llm_result, embeddings[i])
+        
+        return results
+    
+    def _resolve_without_llm(self, user_query: str) -> Tuple[Optional[Tuple[str, float, Dict[str, Any]]], Any]:
+        """
+        LLM 호출 없이 결정 가능한 단계를 순서대로 시도합니다.
+        (캐시 → 명확한 키워드 → 표현만 다른 유사 질문의 이전 분류 결과)
         
-        return final_agent, confidence, analysis
+        Returns:
+            Tuple: (분류 결과 또는 None, 의미 기반 캐시 저장에 쓸 임베딩)
+        """
+        key = _normalize_query(user_query)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._from_cache(user_query, cached), None
+        
+        # 명확한 키워드만으로 결정 가능한 경우 LLM 생략
+        fast_result = self._fast_path_classification(user_query)
+        if fast_result is not None:
+            self._cache_set(key, fast_result)
+            return fast_result, None
+        
+        semantic_result, embedding = self._semantic_lookup(user_query)
+        if semantic_result is not None:
+            self._cache_set(key, semantic_result)
+        return semantic_result, embedding
+    
+    def _finish_classification(self, user_query: str, llm_result: Dict[str, Any],
+                               embedding) -> Tuple[str, float, Dict[str, Any]]:
+        """
+        키워드 분류와 LLM 분류를 통합하여 최종 결정하고 캐시에 저장합니다.
+        LLM 호출 실패나 응답 해석 실패(cacheable=False)로 만들어진 결과는 캐시하지 않습니다.
+        """
+        cacheable = llm_result.pop("cacheable", True)
+        keyword_result = self._keyword_classification(user_query)
+        result = self._combine_results(keyword_result, llm_result, user_query)
+        
+        if cacheable:
+            self._cache_set(_normalize_query(user_query), result)
+            self._semantic_insert(user_query, result, embedding)
+        
+        return result
+    
+    def _fast_path_classification(self, query: str) -> Optional[Tuple[str, float, Dict[str, Any]]]:
+        """
+        한쪽 에이전트의 키워드만 2개 이상 포함된 질문은 LLM 없이 바로 분류합니다.
+        
+        Args:
+            query: 사용자 질문
+            
+        Returns:
+            Tuple[str, float, Dict]: 확정된 경우 (에이전트, 신뢰도, 분석 정보), 애매하면 None
+        """
+        query_lower = query.lower()
+        docs_matches = [kw for kw in _DOCS_FAST_KEYWORDS if kw in query_lower]
+        employee_matches = [kw for kw in _EMPLOYEE_FAST_KEYWORDS if kw in query_lower]
+        
+        if docs_matches and employee_matches:
+            return None
+        
+        matches = docs_matches or employee_matches
+        if len(matches) < 2:
+            return None
+        
+        agent = "docs_agent" if docs_matches else "employee_agent"
+        return agent, 0.95, {
+            "source": "keyword_fast_path",
+            "keyword_analysis": {
+                "agent": agent,
+                "confidence": 0.95,
+                "matched_keywords": sorted(matches)
+            },
+            "agreement": True,
+            "original_query": query
+        }
     
     def _keyword_classification(self, query: str) -> Dict[str, Any]:
         """
@@ -103,10 +414,10 @@ class AgentClassifier:
                     matches.append(keyword)
             
             # 패턴 매칭
-            for pattern in config["patterns"]:
-                if re.search(pattern, query_lower):
+            for pattern in self._compiled_patterns[agent]:
+                if pattern.search(query_lower):
                     score += 2  # 패턴 매칭에 더 높은 가중치
-                    matches.append(f"pattern: {pattern}")
+                    matches.append(f"pattern: {pattern.pattern}")
             
             scores[agent] = score
             matched_keywords[agent] = matches
@@ -143,7 +454,135 @@ class AgentClassifier:
         Returns:
             Dict: LLM 분류 결과
         """
-        classification_prompt = ChatPromptTemplate.from_messages([
+        classification_prompt = self._classification_prompt()
+        
+        try:
+            LLM_RATE_LIMIT.wait()
+            response = self.llm.invoke(classification_prompt.format_messages(query=query))
+            return self._parse_llm_response(response.content)
+            
+        except Exception as e:
+            print(f"[WARNING] LLM 분류 오류: {e}")
+            return _llm_failure(f"분류 오류: {str(e)}")
+    
+    async def _allm_classification(self, query: str) -> Dict[str, Any]:
+        """
+        LLM을 사용한 정밀 분류 (비동기)
+        
+        Args:
+            query: 사용자 질문
+            
+        Returns:
+            Dict: LLM 분류 결과
+        """
+        classification_prompt = self._classification_prompt()
+        
+        try:
+            await LLM_RATE_LIMIT.await_token()
+            response = await self.llm.ainvoke(classification_prompt.format_messages(query=query))
+            return self._parse_llm_response(response.content)
+            
+        except Exception as e:
+            print(f"[WARNING] LLM 분류 오류: {e}")
+            return _llm_failure(f"분류 오류: {str(e)}")
+    
+    def _llm_batch_classification(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 질문을 하나의 LLM 호출로 분류
+        질문이 하나뿐이거나 응답을 해석할 수 없으면 질문별 분류로 대체합니다.
+        
+        Args:
+            queries: 사용자 질문 목록
+            
+        Returns:
+            List[Dict]: 질문 순서대로의 LLM 분류 결과
+        """
+        if len(queries) == 1:
+            return [self._llm_classification(queries[0])]
+        
+        numbered = "\n".join(f"{i}) {query}" for i, query in enumerate(queries))
+        
+        try:
+            LLM_RATE_LIMIT.wait()
+            response = self.llm.invoke(self._batch_classification_prompt().format_messages(queries=numbered))
+            parsed = self._parse_llm_batch_response(response.content, len(queries))
+            if parsed is not None:
+                return parsed
+            print("[WARNING] 일괄 분류 응답 해석 실패 - 질문별 분류로 대체")
+        except Exception as e:
+            print(f"[WARNING] LLM 일괄 분류 오류 - 질문별 분류로 대체: {e}")
+        
+        return [self._llm_classification(query) for query in queries]
+    
+    def _batch_classification_prompt(self) -> ChatPromptTemplate:
+        """LLM 일괄 분류 프롬프트"""
+        return ChatPromptTemplate.from_messages([
+            ("system", """
+당신은 사용자의 질문을 분석하여 적절한 에이전트로 분류하는 전문가입니다.
+
+사용 가능한 에이전트:
+1. docs_agent: 문서 작성, 보고서 생성, 신청서 작성
+   - 영업방문 결과보고서
+   - 제품설명회 시행 신청서
+   - 제품설명회 시행 결과보고서
+   
+2. employee_agent: 직원 실적 분석, 성과 평가
+   - 직원별 실적 조회 및 분석
+   - 목표 달성률 분석
+   - 실적 트렌드 분석
+
+번호가 매겨진 여러 질문이 주어집니다. 각 질문을 독립적으로 분류하세요.
+반드시 다음 JSON 배열 형식으로만 응답하세요. 다른 설명이나 텍스트 없이 JSON만 출력하세요:
+[{{"idx": 질문 번호, "agent": "docs_agent 또는 employee_agent", "confidence": 0.0~1.0, "reasoning": "분류 이유", "extracted_intent": "사용자 의도", "key_entities": ["주요 개체들"]}}]
+
+명확하지 않은 질문은 agent를 null, confidence를 0.2 이하로 지정하세요.
+            """),
+            ("human", "{queries}")
+        ])
+    
+    def _parse_llm_batch_response(self, content: str, expected: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        일괄 분류 응답에서 질문 순서대로의 결과 목록을 추출합니다.
+        
+        Args:
+            content: LLM 응답 본문
+            expected: 질문 수
+            
+        Returns:
+            Optional[List[Dict]]: 분류 결과 목록, 누락/형식 오류 시 None
+        """
+        start_idx = content.find('[')
+        end_idx = content.rfind(']')
+        if start_idx == -1 or end_idx == -1:
+            return None
+        
+        try:
+            items = json.loads(content[start_idx:end_idx + 1])
+        except json.JSONDecodeError:
+            return None
+        
+        by_idx = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("idx"), int):
+                by_idx[item.pop("idx")] = item
+        
+        if set(by_idx) != set(range(expected)):
+            return None
+        
+        results = []
+        for i in range(expected):
+            result = by_idx[i]
+            # 유효성 검증
+            if result.get("agent") not in ["docs_agent", "employee_agent", None]:
+                result["agent"] = None
+                result["confidence"] = 0.0
+            results.append(result)
+        
+        return results
+    
+    def _classification_prompt(self) -> ChatPromptTemplate:
+        """LLM 분류 프롬프트"""
+        return ChatPromptTemplate.from_messages([
             ("system", """
 당신은 사용자의 질문을 분석하여 적절한 에이전트로 분류하는 전문가입니다.
 
@@ -169,51 +608,43 @@ class AgentClassifier:
             """),
             ("human", "{query}")
         ])
+    
+    def _parse_llm_response(self, content: str) -> Dict[str, Any]:
+        """
+        LLM 응답에서 분류 결과 JSON을 추출합니다.
         
-        try:
-            response = self.llm.invoke(classification_prompt.format_messages(query=query))
-            content = response.content.strip()
-            
-            # JSON 파싱 - 여러 형태 처리
-            if content.startswith('```json'):
-                content = content.replace('```json', '').replace('```', '').strip()
-            elif content.startswith('```'):
-                content = content.replace('```', '').strip()
-            
-            # JSON 추출 (중괄호 찾기)
-            start_idx = content.find('{')
-            end_idx = content.rfind('}')
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = content[start_idx:end_idx + 1]
-                result = json.loads(json_str)
-            else:
-                # JSON 형식이 없으면 기본값 반환
-                print(f"[WARNING] JSON 형식을 찾을 수 없음: {content[:100]}")
-                return {
-                    "agent": None,
-                    "confidence": 0.0,
-                    "reasoning": "JSON 파싱 실패",
-                    "extracted_intent": "",
-                    "key_entities": []
-                }
-            
-            # 유효성 검증
-            if result.get("agent") not in ["docs_agent", "employee_agent", None]:
-                result["agent"] = None
-                result["confidence"] = 0.0
-            
-            return result
+        Args:
+            content: LLM 응답 본문
             
-        except Exception as e:
-            print(f"[WARNING] LLM 분류 오류: {e}")
-            return {
-                "agent": None,
-                "confidence": 0.0,
-                "reasoning": f"분류 오류: {str(e)}",
-                "extracted_intent": "",
-                "key_entities": []
-            }
+        Returns:
+            Dict: LLM 분류 결과
+        """
+        content = content.strip()
+        
+        # JSON 파싱 - 여러 형태 처리
+        if content.startswith('```json'):
+            content = content.replace('```json', '').replace('```', '').strip()
+        elif content.startswith('```'):
+            content = content.replace('```', '').strip()
+        
+        # JSON 추출 (중괄호 찾기)
+        start_idx = content.find('{')
+        end_idx = content.rfind('}')
+        
+        if start_idx != -1 and end_idx != -1:
+            json_str = content[start_idx:end_idx + 1]
+            result = json.loads(json_str)
+        else:
+            # JSON 형식이 없으면 기본값 반환
+            print(f"[WARNING] JSON 형식을 찾을 수 없음: {content[:100]}")
+            return _llm_failure("JSON 파싱 실패")
+        
+        # 유효성 검증
+        if result.get("agent") not in ["docs_agent", "employee_agent", None]:
+            result["agent"] = None
+            result["confidence"] = 0.0
+        
+        return result
     
     def _combine_results(
         self, 
@@ -292,4 +723,4 @@ class AgentClassifier:
         return self.agent_patterns.get(agent_name, {}).get(
             "description", 
             "알 수 없는 에이전트"
-        )
\ No newline at end of file
+        )
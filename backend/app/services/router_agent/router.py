@@ -2,11 +2,12 @@
 라우터 에이전트 메인 모듈
 사용자 질문을 분류하고 적절한 에이전트로 라우팅합니다.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 import uuid
 import json
 from pathlib import Path
@@ -53,7 +54,11 @@ class RouterAgent:
         workflow = StateGraph(RouterState)
         
         # 노드 추가
-        workflow.add_node("classify_query", self._classify_query_node)
+        # run()은 동기 분류, arun()은 비동기 분류(LLM 대기 중 이벤트 루프 양보)로 실행
+        workflow.add_node(
+            "classify_query",
+            RunnableLambda(self._classify_query_node, afunc=self._aclassify_query_node)
+        )
         workflow.add_node("route_to_agent", self._route_to_agent_node)
         workflow.add_node("aggregate_result", self._aggregate_result_node)
         
@@ -77,44 +82,75 @@ class RouterAgent:
         Returns:
             RouterState: 업데이트된 상태
         """
+        # 최신 사용자 메시지 추출
+        if not state.get("messages"):
+            state["error"] = "메시지가 없습니다."
+            return state
+        
+        user_query = state["messages"][-1].content
+        print(f"[CLASSIFY] 질문 분류 중: {user_query}")
+        
         try:
-            # 최신 사용자 메시지 추출
-            if not state.get("messages"):
-                state["error"] = "메시지가 없습니다."
-                return state
-            
-            user_query = state["messages"][-1].content
-            print(f"[CLASSIFY] 질문 분류 중: {user_query}")
-            
-            # 질문 분류
-            agent_name, confidence, analysis = self.classifier.classify(user_query)
-            
-            print(f"[CLASSIFY] 결과: {agent_name} (신뢰도: {confidence:.2f})")
-            
-            # 상태 업데이트
-            state["target_agent"] = agent_name
-            state["classification_confidence"] = confidence
-            
-            # 분석 정보를 sub_agent_state에 저장
-            state["sub_agent_state"] = {
-                "classification_analysis": analysis,
-                "original_query": user_query
-            }
-            
-            # 낮은 신뢰도 경고
-            if confidence < 0.5:
-                print(f"[WARNING] 낮은 분류 신뢰도: {confidence:.2f}")
-                if analysis.get("fallback"):
-                    print("[INFO] 기본값(docs_agent)으로 진행합니다.")
+            classification = self.classifier.classify(user_query)
+        except Exception as e:
+            return self._apply_classification_error(state, e)
+        return self._apply_classification(state, user_query, classification)
+    
+    async def _aclassify_query_node(self, state: RouterState) -> RouterState:
+        """
+        _classify_query_node의 비동기 버전 (graph.ainvoke 실행 시 사용)
+        
+        Args:
+            state: 현재 상태
             
+        Returns:
+            RouterState: 업데이트된 상태
+        """
+        if not state.get("messages"):
+            state["error"] = "메시지가 없습니다."
+            return state
+        
+        user_query = state["messages"][-1].content
+        print(f"[CLASSIFY] 질문 분류 중: {user_query}")
+        
+        try:
+            classification = await self.classifier.aclassify(user_query)
         except Exception as e:
-            print(f"[ERROR] 질문 분류 오류: {e}")
-            state["error"] = f"질문 분류 오류: {str(e)}"
-            state["target_agent"] = "docs_agent"  # 오류 시 기본값
-            state["classification_confidence"] = 0.1
+            return self._apply_classification_error(state, e)
+        return self._apply_classification(state, user_query, classification)
+    
+    def _apply_classification(self, state: RouterState, user_query: str,
+                              classification: Tuple[str, float, Dict[str, Any]]) -> RouterState:
+        """분류 결과를 상태에 반영"""
+        agent_name, confidence, analysis = classification
+        print(f"[CLASSIFY] 결과: {agent_name} (신뢰도: {confidence:.2f})")
+        
+        # 상태 업데이트
+        state["target_agent"] = agent_name
+        state["classification_confidence"] = confidence
+        
+        # 분석 정보를 sub_agent_state에 저장
+        state["sub_agent_state"] = {
+            "classification_analysis": analysis,
+            "original_query": user_query
+        }
+        
+        # 낮은 신뢰도 경고
+        if confidence < 0.5:
+            print(f"[WARNING] 낮은 분류 신뢰도: {confidence:.2f}")
+            if analysis.get("fallback"):
+                print("[INFO] 기본값(docs_agent)으로 진행합니다.")
         
         return state
     
+    def _apply_classification_error(self, state: RouterState, error: Exception) -> RouterState:
+        """분류 실패 시 기본 에이전트로 진행하도록 상태 설정"""
+        print(f"[ERROR] 질문 분류 오류: {error}")
+        state["error"] = f"질문 분류 오류: {str(error)}"
+        state["target_agent"] = "docs_agent"  # 오류 시 기본값
+        state["classification_confidence"] = 0.1
+        return state
+    
     def _route_to_agent_node(self, state: RouterState) -> RouterState:
         """
         분류된 에이전트로 라우팅하는 노드
@@ -269,18 +305,7 @@ class RouterAgent:
         if not session_id:
             session_id = str(uuid.uuid4())
         
-        # 초기 상태 생성
-        initial_state = {
-            "messages": [HumanMessage(content=user_query)],
-            "session_id": session_id,
-            "agent_type": "router",
-            "error": None,
-            "target_agent": None,
-            "sub_agent_state": None,
-            "sub_agent_result": None,
-            "requires_interrupt": False,  # 기본값을 False로 설정
-            "classification_confidence": None
-        }
+        initial_state = self._create_initial_state(user_query, session_id)
         
         # 설정
         config = {"configurable": {"thread_id": session_id}}
@@ -288,19 +313,41 @@ class RouterAgent:
         try:
             # 그래프 실행
             result = self.graph.invoke(initial_state, config)
+            return self._format_run_result(result, session_id)
             
-            # 결과 처리
-            sub_result = result.get("sub_agent_result", {})
-            
+        except Exception as e:
+            print(f"[ERROR] 라우터 실행 오류: {e}")
             return {
-                "success": not bool(result.get("error")),
+                "success": False,
                 "session_id": session_id,
-                "target_agent": result.get("target_agent"),
-                "classification_confidence": result.get("classification_confidence"),
-                "requires_interrupt": result.get("requires_interrupt", False),
-                "result": sub_result,
-                "error": result.get("error")
+                "error": str(e)
             }
+    
+    async def arun(self, user_query: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        라우터 에이전트 비동기 실행
+        여러 질문을 asyncio.gather로 동시에 처리할 때 사용합니다.
+        
+        Args:
+            user_query: 사용자 질문
+            session_id: 세션 ID (선택사항)
+            
+        Returns:
+            Dict: 실행 결과
+        """
+        # 세션 ID 생성 또는 사용
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        initial_state = self._create_initial_state(user_query, session_id)
+        
+        # 설정
+        config = {"configurable": {"thread_id": session_id}}
+        
+        try:
+            # 그래프 실행 (동기 노드는 LangGraph가 실행기 스레드에서 처리)
+            result = await self.graph.ainvoke(initial_state, config)
+            return self._format_run_result(result, session_id)
             
         except Exception as e:
             print(f"[ERROR] 라우터 실행 오류: {e}")
@@ -310,6 +357,47 @@ class RouterAgent:
                 "error": str(e)
             }
     
+    def classify_batch(self, queries: List[str]) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        여러 질문을 라우팅 없이 분류만 수행합니다.
+        LLM 호출은 분류기에서 여러 질문씩 묶어 처리합니다.
+        
+        Args:
+            queries: 사용자 질문 목록
+            
+        Returns:
+            List[Tuple[str, float, Dict]]: 입력 순서와 같은 (에이전트, 신뢰도, 분석 정보) 목록
+        """
+        return self.classifier.classify_batch(queries)
+    
+    def _create_initial_state(self, user_query: str, session_id: str) -> RouterState:
+        """라우터 그래프 초기 상태 생성"""
+        return {
+            "messages": [HumanMessage(content=user_query)],
+            "session_id": session_id,
+            "agent_type": "router",
+            "error": None,
+            "target_agent": None,
+            "sub_agent_state": None,
+            "sub_agent_result": None,
+            "requires_interrupt": False,  # 기본값을 False로 설정
+            "classification_confidence": None
+        }
+    
+    def _format_run_result(self, result: Dict[str, Any], session_id: str) -> Dict[str, Any]:
+        """그래프 실행 결과를 run 반환 형식으로 변환"""
+        sub_result = result.get("sub_agent_result", {})
+        
+        return {
+            "success": not bool(result.get("error")),
+            "session_id": session_id,
+            "target_agent": result.get("target_agent"),
+            "classification_confidence": result.get("classification_confidence"),
+            "requires_interrupt": result.get("requires_interrupt", False),
+            "result": sub_result,
+            "error": result.get("error")
+        }
+    
     def resume_session(self, session_id: str, user_reply: str, reply_type: str = "user_reply") -> Dict[str, Any]:
         """
         인터럽트된 세션 재개
@@ -0,0 +1,122 @@
+"""
+성과 분석 수치 커널
+
+calculation_tools에서 사용하는 회귀 계산 핵심 루프와 스칼라 커널입니다.
+numba가 설치된 빌드 환경에서는 아래 명령으로 AOT 확장 모듈(calc_kernels)을
+미리 컴파일해 두면, 첫 호출 시 JIT 컴파일 지연 없이 네이티브 코드가 사용됩니다.
+
+    python -m backend.app.services.tools._calc_kernels
+
+확장 모듈이 없으면 회귀 계산은 calculation_tools의 numpy 구현을,
+스칼라 커널은 이 모듈의 Python 함수를 그대로 사용합니다.
+아래 함수들은 numba nopython 모드로 컴파일되는 것을 전제로 작성되어,
+다른 numba 커널에서 호출하면 인라인됩니다.
+"""
+
+import os
+from typing import Tuple
+
+
+def ols_stats(y) -> Tuple[float, float, float]:
+    """
+    x = 0..n-1 에 대한 단순 선형회귀 통계를 계산합니다.
+
+    Args:
+        y: float64 연속 배열
+
+    Returns:
+        Tuple[float, float, float]: (기울기, 절편, 결정계수)
+    """
+    n = y.shape[0]
+    x_mean = (n - 1) / 2.0
+
+    y_sum = 0.0
+    for i in range(n):
+        y_sum += y[i]
+    y_mean = y_sum / n
+
+    numerator = 0.0
+    denominator = 0.0
+    ss_tot = 0.0
+    for i in range(n):
+        x_dev = i - x_mean
+        y_dev = y[i] - y_mean
+        numerator += x_dev * y_dev
+        denominator += x_dev * x_dev
+        ss_tot += y_dev * y_dev
+
+    slope = 0.0 if denominator == 0 else numerator / denominator
+    intercept = y_mean - slope * x_mean
+
+    ss_res = 0.0
+    for i in range(n):
+        residual = y[i] - (slope * i + intercept)
+        ss_res += residual * residual
+
+    if ss_tot == 0:
+        r_squared = 1.0 if ss_res == 0 else 0.0
+    else:
+        r_squared = 1.0 - ss_res / ss_tot
+
+    return slope, intercept, r_squared
+
+
+def forecast_core(y) -> Tuple[float, float]:
+    """
+    최소자승법 정규방정식으로 예측용 기울기와 절편을 계산합니다.
+
+    Args:
+        y: float64 연속 배열
+
+    Returns:
+        Tuple[float, float]: (기울기, 절편)
+    """
+    n = y.shape[0]
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    sum_x2 = 0.0
+    for i in range(n):
+        sum_x += i
+        sum_y += y[i]
+        sum_xy += i * y[i]
+        sum_x2 += i * i
+
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / n
+    return slope, intercept
+
+
+def achievement_kernel(performance: float, target: float) -> Tuple[float, float]:
+    """
+    달성률과 목표 대비 차이를 계산합니다 (target > 0 전제).
+
+    Returns:
+        Tuple[float, float]: (달성률(%), 차이 금액)
+    """
+    return performance / target * 100.0, performance - target
+
+
+def growth_kernel(current: float, previous: float) -> float:
+    """이전 값 대비 성장률(%)을 계산합니다. 이전 값이 0 이하면 0을 반환합니다."""
+    if previous <= 0:
+        return 0.0
+    return (current - previous) / previous * 100.0
+
+
+def build(output_dir: str = None) -> None:
+    """numba.pycc로 calc_kernels 확장 모듈을 AOT 컴파일합니다 (빌드 단계 전용)."""
+    from numba.pycc import CC
+
+    cc = CC("calc_kernels")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export("ols_stats", "Tuple((float64, float64, float64))(float64[::1])")(ols_stats)
+    cc.export("forecast_core", "Tuple((float64, float64))(float64[::1])")(forecast_core)
+    cc.export("achievement_kernel", "UniTuple(float64, 2)(float64, float64)")(achievement_kernel)
+    cc.export("growth_kernel", "float64(float64, float64)")(growth_kernel)
+    cc.compile()
+    print(f"[KERNELS] calc_kernels 컴파일 완료: {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    build()
@@ -1,8 +1,425 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from bisect import bisect_right
 import statistics
+import copy
+
+from . import _calc_kernels
+
+# AOT 컴파일된 커널 (_calc_kernels 참고). 빌드되지 않았으면 numpy/Python 경로 사용
+try:
+    from . import calc_kernels as _native_kernels
+except ImportError:
+    _native_kernels = None
+
+_scalar_kernels = _native_kernels if _native_kernels is not None else _calc_kernels
+
+# 달성률 20%p 구간별 평가 (60 미만, 60~80, 80~100, 100~120, 120 이상)
+_ACHIEVEMENT_LEVELS = ("개선 필요", "보통", "양호", "우수", "매우 우수")
+
+# 변동계수(%) 구간별 안정성 평가 (경계값은 다음 구간에 포함)
+_CV_BINS = (10, 20, 30, 50)
+_STABILITY_LEVELS = ("매우 안정", "안정", "보통", "불안정", "매우 불안정")
+
+# 상관계수 절대값 구간별 강도 (경계값은 다음 구간에 포함)
+_CORRELATION_BINS = (0.2, 0.4, 0.6, 0.8)
+_CORRELATION_LEVELS = ("매우 약함", "약함", "보통", "강함", "매우 강함")
+
+# 이 길이 이하의 입력은 numpy/캐시를 거치지 않고 Python 스칼라 연산으로 처리
+_TINY_INPUT_SIZE = 8
+
+# 캐시 적중 통계 (운영 환경에서 적중률 관찰용)
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _as_key(values) -> bytes:
+    """입력 수치 목록을 캐시 키(float64 바이트열)로 변환합니다."""
+    return np.ascontiguousarray(values, dtype=np.float64).tobytes()
+
+
+def _from_key(data_bytes: bytes) -> np.ndarray:
+    """캐시 키 바이트열을 float64 배열로 복원합니다."""
+    return np.frombuffer(data_bytes, dtype=np.float64)
+
+
+# list-of-dicts, dict-of-lists, DataFrame 중 하나
+SeriesInput = Union[List[Dict[str, Any]], Dict[str, List[Any]], pd.DataFrame]
+
+
+def _to_soa(data: SeriesInput, keys: Tuple[str, ...]) -> Tuple[np.ndarray, ...]:
+    """
+    행 단위(AoS) 입력을 키별 연속 배열(SoA)로 변환합니다.
+
+    Args:
+        data: list-of-dicts, dict-of-lists 또는 DataFrame
+        keys: 추출할 컬럼 이름
+
+    Returns:
+        Tuple[np.ndarray, ...]: keys 순서대로의 컬럼 배열
+    """
+    if isinstance(data, pd.DataFrame):
+        return tuple(data[key].to_numpy() for key in keys)
+    if isinstance(data, dict):
+        return tuple(np.asarray(data[key]) for key in keys)
+    return tuple(np.array([row[key] for row in data]) for key in keys)
+
+
+def _as_float_column(values: np.ndarray) -> np.ndarray:
+    """
+    컬럼 배열을 float64로 변환합니다.
+    숫자 배열은 그대로 변환하고, object 배열은 값마다 float 변환하여 None 등이 nan이 되지 않도록 TypeError를 발생시킵니다.
+    """
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64)
+    return np.array([float(v) for v in values.tolist()], dtype=np.float64)
+
+
+def _to_records(data: SeriesInput) -> List[Dict[str, Any]]:
+    """입력을 행 단위 dict 목록으로 변환합니다 (list-of-dicts는 그대로 반환)."""
+    if isinstance(data, pd.DataFrame):
+        return data.to_dict("records")
+    if isinstance(data, dict):
+        return [dict(zip(data.keys(), row)) for row in zip(*data.values())]
+    return list(data)
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    값 기준 상위 k개 인덱스를 내림차순으로 반환합니다 (전체 정렬 없이 O(n) 선택).
+    동일 값은 입력 순서를 유지하여 안정 정렬 결과의 앞부분과 일치합니다.
+    """
+    if k >= len(values):
+        return np.argsort(-values, kind="stable")
+    
+    # k번째 큰 값을 경계로 초과분은 모두, 경계값은 앞선 인덱스부터 채움
+    kth_value = values[np.argpartition(-values, k - 1)[k - 1]]
+    above = np.flatnonzero(values > kth_value)
+    ties = np.flatnonzero(values == kth_value)[:k - len(above)]
+    candidates = np.concatenate([above, ties])
+    return candidates[np.argsort(-values[candidates], kind="stable")]
+
+
+def _mean_and_variance(values: List[float]) -> Tuple[float, float]:
+    """파이썬 스칼라 연산만으로 평균과 모분산을 계산합니다."""
+    n = len(values)
+    mean = sum(values) / n
+    variance = sum((v - mean) ** 2 for v in values) / n
+    return mean, variance
+
+
+def _memoize(func):
+    """
+    순수 계산 함수를 LRU 캐시로 감쌉니다.
+    호출자가 결과를 수정해도 캐시가 오염되지 않도록 사본을 반환합니다.
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(*args):
+        hits_before = cached.cache_info().hits
+        result = cached(*args)
+        if cached.cache_info().hits > hits_before:
+            CACHE_STATS["hits"] += 1
+        else:
+            CACHE_STATS["misses"] += 1
+        return copy.deepcopy(result)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _trend_result(slope: float, intercept: float, r_squared: float, y_mean: float) -> Dict[str, Any]:
+    """회귀 결과로 트렌드를 분류하고 응답 형태로 구성합니다."""
+    # 트렌드 분류
+    if abs(slope) < y_mean * 0.01:  # 평균의 1% 미만
+        trend = "안정"
+        trend_strength = "낮음"
+    elif slope > y_mean * 0.05:  # 평균의 5% 이상 증가
+        trend = "강한 상승"
+        trend_strength = "높음"
+    elif slope > 0:
+        trend = "상승"
+        trend_strength = "보통"
+    elif slope < -y_mean * 0.05:  # 평균의 5% 이상 감소
+        trend = "강한 하락"
+        trend_strength = "높음"
+    else:
+        trend = "하락"
+        trend_strength = "보통"
+    
+    return {
+        "trend": trend,
+        "trend_strength": trend_strength,
+        "r_squared": r_squared,
+        "slope": slope,
+        "intercept": intercept,
+        "analysis": f"{trend} 트렌드 (신뢰도: {r_squared:.2f})"
+    }
+
+
+def _trend_failure(e: Exception) -> Dict[str, Any]:
+    """트렌드 분석 실패 응답"""
+    return {
+        "trend": "분석 실패",
+        "trend_strength": "없음",
+        "r_squared": 0.0,
+        "slope": 0.0,
+        "analysis": f"트렌드 분석 중 오류: {e}"
+    }
+
+
+def _tiny_trend_analysis(amounts: List[float]) -> Dict[str, Any]:
+    """소규모 입력용 트렌드 분석 (numpy 배열을 만들지 않고 Python 스칼라로만 계산)"""
+    try:
+        y = [float(v) for v in amounts]
+        n = len(y)
+        x_mean = (n - 1) / 2
+        y_mean = sum(y) / n
+        
+        numerator = 0.0
+        denominator = 0.0
+        ss_tot = 0.0
+        for i, v in enumerate(y):
+            x_dev = i - x_mean
+            y_dev = v - y_mean
+            numerator += x_dev * y_dev
+            denominator += x_dev * x_dev
+            ss_tot += y_dev * y_dev
+        
+        slope = numerator / denominator if denominator != 0 else 0.0
+        intercept = y_mean - slope * x_mean
+        
+        ss_res = sum((v - (slope * i + intercept)) ** 2 for i, v in enumerate(y))
+        if ss_tot == 0:
+            r_squared = 1.0 if ss_res == 0 else 0.0
+        else:
+            r_squared = 1 - (ss_res / ss_tot)
+        
+        return _trend_result(slope, intercept, r_squared, y_mean)
+        
+    except Exception as e:
+        return _trend_failure(e)
+
+
+@_memoize
+def _trend_analysis_cached(data_bytes: bytes) -> Dict[str, Any]:
+    """트렌드 분석 본체 (입력 바이트열 기준 캐시)"""
+    try:
+        # 선형 회귀 분석 (벡터 연산 후 스칼라는 한 번만 Python float로 변환)
+        y = _from_key(data_bytes)
+        n = len(y)
+        
+        # 기본 통계
+        y_mean = float(y.mean())
+        
+        if _native_kernels is not None:
+            slope, intercept, r_squared = _native_kernels.ols_stats(y)
+        else:
+            x = np.arange(n)
+            x_mean = (n - 1) / 2
+            x_dev = x - x_mean
+            y_dev = y - y_mean
+            
+            # 기울기와 절편 계산
+            numerator = float(x_dev @ y_dev)
+            denominator = float(x_dev @ x_dev)
+            
+            if denominator == 0:
+                slope = 0.0
+            else:
+                slope = numerator / denominator
+            
+            intercept = y_mean - slope * x_mean
+            
+            # R² 계산
+            residuals = y - (slope * x + intercept)
+            ss_res = float(residuals @ residuals)
+            ss_tot = float(y_dev @ y_dev)
+            
+            if ss_tot == 0:
+                r_squared = 1.0 if ss_res == 0 else 0.0
+            else:
+                r_squared = 1 - (ss_res / ss_tot)
+        
+        return _trend_result(slope, intercept, r_squared, y_mean)
+        
+    except Exception as e:
+        return _trend_failure(e)
+
+
+def _variance_result(values: List[float]) -> Dict[str, Any]:
+    """분산 분석 본체 (Python 스칼라 연산)"""
+    try:
+        # 소규모 입력에서는 numpy 디스패치보다 Python 스칼라 연산이 빠름
+        values = [float(v) for v in values]
+        mean_val, variance = _mean_and_variance(values)
+        std_dev = variance ** 0.5
+        
+        if mean_val > 0:
+            cv = (std_dev / mean_val) * 100
+        else:
+            cv = 0.0
+        
+        # 안정성 평가
+        stability = _STABILITY_LEVELS[bisect_right(_CV_BINS, cv)]
+        
+        return {
+            "variance": variance,
+            "std_deviation": std_dev,
+            "coefficient_of_variation": cv,
+            "stability": stability,
+            "mean": mean_val
+        }
+        
+    except Exception:
+        return _variance_failure()
+
+
+def _variance_failure() -> Dict[str, Any]:
+    """분산 분석 실패 응답"""
+    return {
+        "variance": 0.0,
+        "std_deviation": 0.0,
+        "coefficient_of_variation": 0.0,
+        "stability": "분석 실패"
+    }
+
+
+@_memoize
+def _variance_analysis_cached(data_bytes: bytes) -> Dict[str, Any]:
+    """분산 분석 (입력 바이트열 기준 캐시)"""
+    return _variance_result(_from_key(data_bytes).tolist())
+
+
+@_memoize
+def _correlation_analysis_cached(data_bytes: bytes) -> Dict[str, Any]:
+    """상관관계 분석 본체 (x, y를 이어 붙인 바이트열 기준 캐시)"""
+    x, y = np.split(_from_key(data_bytes), 2)
+    
+    # 피어슨 상관계수 계산 (2x2 상관행렬 대신 편차 벡터 내적으로 직접 계산)
+    x_dev = x - x.mean()
+    y_dev = y - y.mean()
+    correlation = float(np.clip((x_dev @ y_dev) / np.sqrt((x_dev @ x_dev) * (y_dev @ y_dev)), -1.0, 1.0))
+    
+    # 상관관계 강도 분류
+    abs_corr = abs(correlation)
+    if abs_corr == abs_corr:
+        strength = _CORRELATION_LEVELS[bisect_right(_CORRELATION_BINS, abs_corr)]
+    else:
+        # 상수 입력 등으로 상관계수가 NaN인 경우
+        strength = _CORRELATION_LEVELS[0]
+    
+    # 관계 방향 (float 값으로 비교)
+    if correlation > 0:
+        relationship = "양의 상관관계"
+    elif correlation < 0:
+        relationship = "음의 상관관계"
+    else:
+        relationship = "상관관계 없음"
+    
+    return {
+        "correlation": round(correlation, 3),
+        "strength": strength,
+        "relationship": relationship
+    }
+
+
+def _forecast_result(historical_data: List[float], slope: float, intercept: float, periods: int) -> Dict[str, Any]:
+    """회귀 계수와 이동평균을 결합해 예측값과 신뢰도를 구성합니다."""
+    n = len(historical_data)
+    
+    # 이동평균 예측
+    window = min(3, n)
+    moving_avg = sum(historical_data[-window:]) / window
+    
+    # 이동평균과 선형회귀의 가중치
+    weight_linear = 0.7 if slope > 0 else 0.3
+    weight_moving = 1 - weight_linear
+    
+    # 예측값 생성
+    forecast = []
+    for i in range(periods):
+        future_x = n + i
+        linear_pred = slope * future_x + intercept
+        combined_pred = weight_linear * linear_pred + weight_moving * moving_avg
+        forecast.append(max(0.0, round(combined_pred, 2)))
+    
+    # 신뢰도 계산 (데이터 수와 트렌드 일관성 기반)
+    data_confidence = min(1.0, n / 12)
+    
+    # 트렌드 일관성 확인
+    recent_changes = []
+    for i in range(1, min(6, n)):
+        prev_val = historical_data[-i-1]
+        if prev_val != 0:
+            recent_changes.append((historical_data[-i] - prev_val) / prev_val)
+    
+    trend_consistency = 1 - (_mean_and_variance(recent_changes)[1] ** 0.5 if recent_changes else 0)
+    trend_consistency = max(0.0, min(1.0, trend_consistency))
+    
+    overall_confidence = (data_confidence + trend_consistency) / 2
+    
+    if overall_confidence > 0.7:
+        confidence = "높음"
+    elif overall_confidence > 0.4:
+        confidence = "보통"
+    else:
+        confidence = "낮음"
+    
+    return {
+        "method": "가중 평균 (선형회귀 + 이동평균)",
+        "forecast": forecast,
+        "confidence": confidence,
+        "confidence_score": round(overall_confidence, 3)
+    }
+
+
+def _tiny_forecast(historical_data: List[float], periods: int) -> Dict[str, Any]:
+    """소규모 입력용 예측 (numpy 배열을 만들지 않고 Python 스칼라로만 계산)"""
+    y = [float(v) for v in historical_data]
+    n = len(y)
+    
+    sum_x = n * (n - 1) / 2
+    sum_y = sum(y)
+    sum_xy = sum(i * v for i, v in enumerate(y))
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+    
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / n
+    return _forecast_result(y, slope, intercept, periods)
+
+
+@_memoize
+def _forecast_cached(data_bytes: bytes, periods: int) -> Dict[str, Any]:
+    """예측 계산 본체 (입력 바이트열, 예측 기간 기준 캐시)"""
+    y = _from_key(data_bytes)
+    historical_data = y.tolist()
+    n = len(historical_data)
+    
+    # 선형회귀 예측 (최소자승법, 합계만 벡터 연산 후 Python float로 변환)
+    if _native_kernels is not None:
+        slope, intercept = _native_kernels.forecast_core(y)
+    else:
+        x = np.arange(n)
+        sum_x = float(x.sum())
+        sum_y = float(y.sum())
+        sum_xy = float(x @ y)
+        sum_x2 = float(x @ x)
+        
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+        intercept = (sum_y - slope * sum_x) / n
+    
+    return _forecast_result(historical_data, slope, intercept, periods)
+
+
+# 벤치마크 대비 비율 구간 (0.8, 1.0, 1.2) 별 등급
+_BENCHMARK_BINS = np.array([0.8, 1.0, 1.2])
+_BENCHMARK_LEVELS = np.array(["미흡", "보통", "양호", "우수"])
+
 
 class PerformanceCalculationTools:
     """실적 분석 계산 도구 클래스"""
@@ -17,32 +434,19 @@ class PerformanceCalculationTools:
                 "evaluation": "목표 없음"
             }
         
-        achievement_rate = (performance / target) * 100
-        gap_amount = performance - target
-        
-        if achievement_rate >= 120:
-            evaluation = "매우 우수"
-        elif achievement_rate >= 100:
-            evaluation = "우수"
-        elif achievement_rate >= 80:
-            evaluation = "양호"
-        elif achievement_rate >= 60:
-            evaluation = "보통"
-        else:
-            evaluation = "개선 필요"
+        achievement_rate, gap_amount = _scalar_kernels.achievement_kernel(float(performance), float(target))
+        evaluation = _ACHIEVEMENT_LEVELS[int(min(120.0, max(40.0, achievement_rate)) // 20) - 2]
         
         return {
-            "achievement_rate": float(achievement_rate),  # numpy 타입 방지
-            "gap_amount": float(gap_amount),
+            "achievement_rate": achievement_rate,
+            "gap_amount": gap_amount,
             "evaluation": evaluation
         }
     
     @staticmethod
     def calculate_growth_rate(current: float, previous: float) -> float:
         """성장률을 계산합니다."""
-        if previous <= 0:
-            return 0.0
-        return float((current - previous) / previous * 100)  # numpy 타입 방지
+        return _scalar_kernels.growth_kernel(float(current), float(previous))
     
     @staticmethod
     def calculate_trend_analysis(amounts: List[float]) -> Dict[str, Any]:
@@ -56,76 +460,59 @@ class PerformanceCalculationTools:
                 "analysis": "분석에 필요한 데이터가 부족합니다."
             }
         
+        if len(amounts) <= _TINY_INPUT_SIZE:
+            return _tiny_trend_analysis(amounts)
+        
+        # float64 배열 변환은 None 등을 조용히 nan으로 바꾸므로 먼저 값마다 float 변환으로 검증
         try:
-            # 선형 회귀 분석
-            x = np.arange(len(amounts))
-            y = np.array(amounts)
-            
-            # 기본 통계
-            n = len(amounts)
-            x_mean = np.mean(x)
-            y_mean = np.mean(y)
-            
-            # 기울기와 절편 계산
-            numerator = np.sum((x - x_mean) * (y - y_mean))
-            denominator = np.sum((x - x_mean) ** 2)
-            
-            if denominator == 0:
-                slope = 0
-            else:
-                slope = numerator / denominator
-            
-            intercept = y_mean - slope * x_mean
-            
-            # R² 계산
-            y_pred = slope * x + intercept
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - y_mean) ** 2)
-            
-            # numpy boolean 연산을 Python bool로 변환
-            if float(ss_tot) == 0:
-                r_squared = 1.0 if float(ss_res) == 0 else 0.0
-            else:
-                r_squared = 1 - (ss_res / ss_tot)
-            
-            # 트렌드 분류 (numpy boolean을 Python bool로 변환)
-            slope_val = float(slope)
-            y_mean_val = float(y_mean)
-            
-            if abs(slope_val) < y_mean_val * 0.01:  # 평균의 1% 미만
-                trend = "안정"
-                trend_strength = "낮음"
-            elif slope_val > y_mean_val * 0.05:  # 평균의 5% 이상 증가
-                trend = "강한 상승"
-                trend_strength = "높음"
-            elif slope_val > 0:
-                trend = "상승"
-                trend_strength = "보통"
-            elif slope_val < -y_mean_val * 0.05:  # 평균의 5% 이상 감소
-                trend = "강한 하락"
-                trend_strength = "높음"
-            else:
-                trend = "하락"
-                trend_strength = "보통"
-            
-            return {
-                "trend": trend,
-                "trend_strength": trend_strength,
-                "r_squared": float(r_squared),  # numpy 타입 방지
-                "slope": float(slope),
-                "intercept": float(intercept),
-                "analysis": f"{trend} 트렌드 (신뢰도: {r_squared:.2f})"
-            }
-            
-        except Exception as e:
-            return {
-                "trend": "분석 실패",
-                "trend_strength": "없음",
-                "r_squared": 0.0,
-                "slope": 0.0,
-                "analysis": f"트렌드 분석 중 오류: {e}"
-            }
-    
+            key = _as_key([float(v) for v in amounts])
+        except (TypeError, ValueError) as e:
+            return _trend_failure(e)
+        
+        return _trend_analysis_cached(key)
+
+    @staticmethod
+    def calculate_trend_analysis_batch(series: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        여러 시계열의 선형 트렌드를 한 번의 행렬 연산으로 계산합니다.
+
+        Args:
+            series: (시계열 수, 기간 수) 형태의 2차원 배열
+
+        Returns:
+            Dict: 시계열별 slope, intercept, r_squared 배열
+        """
+        Y = np.asarray(series, dtype=np.float64)
+        if Y.ndim == 1:
+            Y = Y[np.newaxis, :]
+        m, n = Y.shape
+
+        if n < 2:
+            zeros = np.zeros(m)
+            return {"slope": zeros, "intercept": zeros.copy(), "r_squared": zeros.copy()}
+
+        x = np.arange(n, dtype=np.float64)
+        x_dev = x - x.mean()
+        y_mean = Y.mean(axis=1)
+        Y_dev = Y - y_mean[:, np.newaxis]
+
+        # 기울기와 절편 (행렬-벡터 곱 한 번으로 모든 시계열 처리)
+        slope = (Y_dev @ x_dev) / (x_dev @ x_dev)
+        intercept = y_mean - slope * x.mean()
+
+        # R² 계산 (ss_tot이 0이면 단일 시계열 분석과 동일하게 처리)
+        residuals = Y - (slope[:, np.newaxis] * x + intercept[:, np.newaxis])
+        ss_res = np.einsum("ij,ij->i", residuals, residuals)
+        ss_tot = np.einsum("ij,ij->i", Y_dev, Y_dev)
+        flat = ss_tot == 0
+        r_squared = np.where(
+            flat,
+            (ss_res == 0).astype(np.float64),
+            1 - ss_res / np.where(flat, 1.0, ss_tot)
+        )
+
+        return {"slope": slope, "intercept": intercept, "r_squared": r_squared}
+
     @staticmethod
     def calculate_variance_analysis(amounts: List[float]) -> Dict[str, Any]:
         """분산 분석을 수행합니다."""
@@ -137,51 +524,23 @@ class PerformanceCalculationTools:
                 "stability": "데이터 부족"
             }
         
+        if len(amounts) <= _TINY_INPUT_SIZE:
+            return _variance_result(amounts)
+        
+        # None 등이 nan으로 바뀌지 않도록 값마다 float 변환으로 검증 (실패 시 분석 실패 응답)
         try:
-            amounts_array = np.array(amounts)
-            mean_val = float(np.mean(amounts_array))  # numpy 타입 방지
-            variance = float(np.var(amounts_array))
-            std_dev = float(np.std(amounts_array))
-            
-            # numpy boolean을 Python bool로 변환
-            if float(mean_val) > 0:
-                cv = (std_dev / mean_val) * 100
-            else:
-                cv = 0.0
-            
-            # 안정성 평가 (float 값으로 비교)
-            cv_val = float(cv)
-            if cv_val < 10:
-                stability = "매우 안정"
-            elif cv_val < 20:
-                stability = "안정"
-            elif cv_val < 30:
-                stability = "보통"
-            elif cv_val < 50:
-                stability = "불안정"
-            else:
-                stability = "매우 불안정"
-            
-            return {
-                "variance": variance,
-                "std_deviation": std_dev,
-                "coefficient_of_variation": float(cv),
-                "stability": stability,
-                "mean": mean_val
-            }
-            
-        except Exception as e:
-            return {
-                "variance": 0.0,
-                "std_deviation": 0.0,
-                "coefficient_of_variation": 0.0,
-                "stability": "분석 실패"
-            }
+            key = _as_key([float(v) for v in amounts])
+        except (TypeError, ValueError):
+            return _variance_failure()
+        
+        return _variance_analysis_cached(key)
     
     @staticmethod
-    def calculate_seasonal_analysis(monthly_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def calculate_seasonal_analysis(monthly_data: SeriesInput) -> Dict[str, Any]:
         """계절성 분석 계산"""
-        if len(monthly_data) < 4:
+        months, amounts = _to_soa(monthly_data, ("month", "amount"))
+        
+        if len(amounts) < 4:
             return {
                 "has_seasonality": False,
                 "peak_months": [],
@@ -189,22 +548,17 @@ class PerformanceCalculationTools:
                 "seasonal_factor": {}
             }
         
-        # 월별 평균 계산
-        month_totals = {}
-        for data in monthly_data:
-            month = data["month"][-2:]  # YYYYMM에서 MM 추출
-            amount = data["amount"]
-            
-            if month not in month_totals:
-                month_totals[month] = []
-            month_totals[month].append(amount)
+        # 월별 평균 계산 (YYYYMM에서 MM 추출, 처음 등장한 순서 유지)
+        month_keys = np.array([str(month)[-2:] for month in months.tolist()])
+        unique_months, first_index, inverse = np.unique(month_keys, return_index=True, return_inverse=True)
+        month_sums = np.bincount(inverse, weights=_as_float_column(amounts))
+        month_counts = np.bincount(inverse)
         
-        # 각 월의 평균 계산
-        month_averages = {}
-        for month, amounts in month_totals.items():
-            month_averages[month] = float(np.mean(amounts))  # numpy 타입 방지
+        appearance = np.argsort(first_index)
+        month_names = unique_months[appearance].tolist()
+        averages = (month_sums / month_counts)[appearance]
         
-        if len(month_averages) < 2:
+        if len(month_names) < 2:
             return {
                 "has_seasonality": False,
                 "peak_months": [],
@@ -212,25 +566,20 @@ class PerformanceCalculationTools:
                 "seasonal_factor": {}
             }
         
-        overall_average = float(np.mean(list(month_averages.values())))  # numpy 타입 방지
+        overall_average = float(averages.mean())
         
         # 계절성 지수 계산
-        seasonal_factors = {}
-        for month, avg in month_averages.items():
-            seasonal_factors[month] = float(avg / overall_average)  # numpy 타입 방지
+        seasonal_factors = (averages / overall_average).tolist()
         
         # 피크와 저점 월 찾기
-        sorted_months = sorted(month_averages.items(), key=lambda x: x[1], reverse=True)
-        peak_months = [month for month, _ in sorted_months[:2]]
-        low_months = [month for month, _ in sorted_months[-2:]]
+        ranked = np.argsort(-averages, kind="stable").tolist()
+        peak_months = [month_names[i] for i in ranked[:2]]
+        low_months = [month_names[i] for i in ranked[-2:]]
         
         # 계절성 존재 여부 판단 (최고와 최저의 차이가 평균의 20% 이상)
-        max_avg = float(max(month_averages.values()))  # numpy 타입 방지
-        min_avg = float(min(month_averages.values()))  # numpy 타입 방지
-        has_seasonality = bool((max_avg - min_avg) / overall_average > 0.2)  # numpy.bool → bool 변환
+        strength_ratio = float(averages.max() - averages.min()) / overall_average
+        has_seasonality = strength_ratio > 0.2
         
-        # seasonality_strength 계산에서도 Python float 사용
-        strength_ratio = (max_avg - min_avg) / overall_average
         if strength_ratio > 0.5:
             seasonality_strength = "강함"
         elif strength_ratio > 0.2:
@@ -239,17 +588,31 @@ class PerformanceCalculationTools:
             seasonality_strength = "약함"
         
         return {
-            "has_seasonality": has_seasonality,  # 이제 Python bool
+            "has_seasonality": has_seasonality,
             "peak_months": peak_months,
             "low_months": low_months,
-            "seasonal_factor": {k: float(round(v, 3)) for k, v in seasonal_factors.items()},  # numpy 타입 방지
+            "seasonal_factor": {k: round(v, 3) for k, v in zip(month_names, seasonal_factors)},
             "seasonality_strength": seasonality_strength
         }
     
     @staticmethod
-    def calculate_pareto_analysis(items: List[Dict[str, Any]], value_key: str = "amount") -> Dict[str, Any]:
-        """파레토 분석 (80-20 법칙) 계산"""
-        if not items:
+    def calculate_pareto_analysis(
+        items: SeriesInput,
+        value_key: str = "amount",
+        return_full_curve: bool = False
+    ) -> Dict[str, Any]:
+        """
+        파레토 분석 (80-20 법칙) 계산
+        
+        Args:
+            items: 분석 대상 항목
+            value_key: 값으로 사용할 키
+            return_full_curve: True면 전체 항목의 누적 기여도 곡선을 반환
+                               (False면 파레토 지점까지만 정렬)
+        """
+        (values,) = _to_soa(items, (value_key,))
+        
+        if len(values) == 0:
             return {
                 "total_items": 0,
                 "top_20_percent": [],
@@ -257,39 +620,57 @@ class PerformanceCalculationTools:
                 "pareto_point": None
             }
         
-        # 값 기준으로 내림차순 정렬
-        sorted_items = sorted(items, key=lambda x: x[value_key], reverse=True)
-        total_value = float(sum(item[value_key] for item in sorted_items))  # numpy 타입 방지
-        
-        # 누적 기여도 계산
-        cumulative_contribution = []
-        cumulative_value = 0.0
+        values = _as_float_column(values)
+        n = len(values)
+        total_value = float(values.sum())
+        top_20_count = max(1, int(n * 0.2))
         
-        for i, item in enumerate(sorted_items):
-            cumulative_value += float(item[value_key])  # numpy 타입 방지
-            contribution_percent = (cumulative_value / total_value) * 100
-            cumulative_contribution.append({
-                "rank": int(i + 1),  # numpy 타입 방지
-                "item": item,
-                "cumulative_percent": float(round(contribution_percent, 2))  # numpy 타입 방지
-            })
+        if return_full_curve or total_value <= 0:
+            order = np.argsort(-values, kind="stable")
+        else:
+            # 상위 20%만 선택 정렬하고, 80%에 못 미치면 그때 전체 정렬
+            order = _top_k_indices(values, top_20_count)
+            if round(float(values[order].sum()) / total_value * 100, 2) < 80:
+                order = np.argsort(-values, kind="stable")
+        
+        # 누적 기여도 계산 (합계가 음수여도 기존과 같이 합계 대비 비율로 계산, 합계 0은 0%)
+        sorted_values = values[order]
+        if total_value != 0:
+            cumulative_percents = [round(p, 2) for p in (np.cumsum(sorted_values) / total_value * 100).tolist()]
+        else:
+            cumulative_percents = [0.0] * len(sorted_values)
         
         # 80% 지점 찾기
         pareto_point = None
-        for contrib in cumulative_contribution:
-            if float(contrib["cumulative_percent"]) >= 80:  # numpy boolean 방지
-                pareto_point = int(contrib["rank"])  # numpy 타입 방지
+        for rank, percent in enumerate(cumulative_percents, start=1):
+            if percent >= 80:
+                pareto_point = rank
                 break
         
+        if not return_full_curve:
+            curve_length = max(top_20_count, pareto_point or 0)
+            order = order[:curve_length]
+            cumulative_percents = cumulative_percents[:curve_length]
+        
+        records = _to_records(items)
+        sorted_items = [records[i] for i in order.tolist()]
+        cumulative_contribution = [
+            {
+                "rank": rank,
+                "item": item,
+                "cumulative_percent": percent
+            }
+            for rank, (item, percent) in enumerate(zip(sorted_items, cumulative_percents), start=1)
+        ]
+        
         # 상위 20% 항목
-        top_20_count = max(1, int(len(sorted_items) * 0.2))
         top_20_percent = sorted_items[:top_20_count]
         
         return {
-            "total_items": int(len(sorted_items)),  # numpy 타입 방지
+            "total_items": n,
             "top_20_percent": top_20_percent,
             "cumulative_contribution": cumulative_contribution,
-            "pareto_point": pareto_point,  # 이미 int로 변환됨
+            "pareto_point": pareto_point,
             "pareto_efficiency": f"상위 {pareto_point}개 항목이 전체의 80% 차지" if pareto_point else "파레토 지점 없음"
         }
     
@@ -303,36 +684,10 @@ class PerformanceCalculationTools:
                 "relationship": "데이터 부족"
             }
         
-        # 피어슨 상관계수 계산
-        correlation_matrix = np.corrcoef(x_values, y_values)
-        correlation = float(correlation_matrix[0, 1])  # numpy scalar → float 변환
-        
-        # 상관관계 강도 분류
-        abs_corr = float(abs(correlation))  # numpy 타입 방지
-        if abs_corr >= 0.8:
-            strength = "매우 강함"
-        elif abs_corr >= 0.6:
-            strength = "강함"
-        elif abs_corr >= 0.4:
-            strength = "보통"
-        elif abs_corr >= 0.2:
-            strength = "약함"
-        else:
-            strength = "매우 약함"
-        
-        # 관계 방향 (float 값으로 비교)
-        if correlation > 0:
-            relationship = "양의 상관관계"
-        elif correlation < 0:
-            relationship = "음의 상관관계"
-        else:
-            relationship = "상관관계 없음"
-        
-        return {
-            "correlation": round(correlation, 3),
-            "strength": strength,
-            "relationship": relationship
-        }
+        # float64 배열 변환은 None 등을 조용히 nan으로 바꾸므로 값마다 float 변환 (숫자가 아니면 TypeError)
+        x_key = _as_key([float(v) for v in x_values])
+        y_key = _as_key([float(v) for v in y_values])
+        return _correlation_analysis_cached(x_key + y_key)
     
     @staticmethod
     def calculate_benchmark_comparison(current_performance: float, benchmarks: Dict[str, float]) -> Dict[str, Any]:
@@ -344,34 +699,37 @@ class PerformanceCalculationTools:
                 "ranking": None
             }
         
-        comparisons = {}
-        for benchmark_name, benchmark_value in benchmarks.items():
-            benchmark_val = float(benchmark_value)  # numpy 타입 방지
-            if benchmark_val > 0:  # Python float 비교
-                ratio = float(current_performance / benchmark_val)  # numpy 타입 방지
-                percentage = float((ratio - 1) * 100)
-                
-                # Python float 비교
-                if ratio >= 1.2:
-                    level = "우수"
-                elif ratio >= 1.0:
-                    level = "양호"
-                elif ratio >= 0.8:
-                    level = "보통"
-                else:
-                    level = "미흡"
-                
-                comparisons[benchmark_name] = {
-                    "benchmark_value": benchmark_val,  # Python float
-                    "ratio": float(round(ratio, 3)),  # numpy 타입 방지
-                    "percentage_diff": float(round(percentage, 2)),
-                    "level": level
-                }
+        # 입력 경계에서 한 번만 Python float로 변환
+        current_performance = float(current_performance)
+        
+        # 벤치마크 값을 연속 배열로 모아 비율/차이/등급을 한 번에 계산
+        names = list(benchmarks.keys())
+        values = np.fromiter((float(v) for v in benchmarks.values()), dtype=np.float64, count=len(names))
+        valid = values > 0
+        ratios = current_performance / values[valid]
+        percentages = (ratios - 1.0) * 100.0
+        levels = _BENCHMARK_LEVELS[np.digitize(ratios, _BENCHMARK_BINS)]
+        
+        valid_names = [name for name, ok in zip(names, valid.tolist()) if ok]
+        comparisons = {
+            name: {
+                "benchmark_value": value,
+                "ratio": round(ratio, 3),
+                "percentage_diff": round(percentage, 2),
+                "level": level
+            }
+            for name, value, ratio, percentage, level in zip(
+                valid_names,
+                values[valid].tolist(),
+                ratios.tolist(),
+                percentages.tolist(),
+                levels.tolist()
+            )
+        }
         
         # 전체 성과 수준 결정
         if comparisons:
-            avg_ratio = float(np.mean([comp["ratio"] for comp in comparisons.values()]))  # numpy 타입 방지
-            # Python float 비교
+            avg_ratio = sum(comp["ratio"] for comp in comparisons.values()) / len(comparisons)
             if avg_ratio >= 1.2:
                 performance_level = "업계 상위"
             elif avg_ratio >= 1.0:
@@ -386,7 +744,7 @@ class PerformanceCalculationTools:
         return {
             "performance_level": performance_level,
             "comparisons": comparisons,
-            "current_performance": float(current_performance)  # numpy 타입 방지
+            "current_performance": current_performance
         }
     
     @staticmethod
@@ -399,64 +757,8 @@ class PerformanceCalculationTools:
                 "confidence": "낮음"
             }
         
-        # 이동평균 예측
-        window = min(3, len(historical_data))
-        moving_avg = float(np.mean(historical_data[-window:]))  # numpy 타입 방지
-        
-        # 선형회귀 예측
-        x = np.arange(len(historical_data))
-        y = np.array(historical_data)
-        
-        # 최소자승법 (numpy scalar을 Python 기본 타입으로 변환)
-        n = len(historical_data)
-        sum_x = float(np.sum(x))  # numpy 타입 방지
-        sum_y = float(np.sum(y))
-        sum_xy = float(np.sum(x * y))
-        sum_x2 = float(np.sum(x * x))
-        
-        slope = float((n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x))  # numpy 타입 방지
-        intercept = float((sum_y - slope * sum_x) / n)
-        
-        # 예측값 생성
-        forecast = []
-        for i in range(periods):
-            future_x = len(historical_data) + i
-            linear_pred = slope * future_x + intercept
-            
-            # 이동평균과 선형회귀의 가중 평균 (Python float 비교)
-            weight_linear = 0.7 if float(slope) > 0 else 0.3  # numpy boolean 방지
-            weight_moving = 1 - weight_linear
-            
-            combined_pred = weight_linear * linear_pred + weight_moving * moving_avg
-            forecast.append(float(max(0, round(combined_pred, 2))))  # numpy 타입 방지
-        
-        # 신뢰도 계산 (데이터 수와 트렌드 일관성 기반)
-        data_confidence = float(min(1.0, len(historical_data) / 12))  # numpy 타입 방지
-        
-        # 트렌드 일관성 확인
-        recent_changes = []
-        for i in range(1, min(6, len(historical_data))):
-            prev_val = float(historical_data[-i-1])  # numpy 타입 방지
-            if prev_val != 0:  # Python float 비교
-                change = float((historical_data[-i] - prev_val) / prev_val)  # numpy 타입 방지
-                recent_changes.append(change)
-        
-        trend_consistency = float(1 - (np.std(recent_changes) if recent_changes else 0))  # numpy 타입 방지
-        trend_consistency = float(max(0, min(1, trend_consistency)))
-        
-        overall_confidence = float((data_confidence + trend_consistency) / 2)  # numpy 타입 방지
-        
-        # Python float 비교
-        if overall_confidence > 0.7:
-            confidence = "높음"
-        elif overall_confidence > 0.4:
-            confidence = "보통"
-        else:
-            confidence = "낮음"
+        if len(historical_data) <= _TINY_INPUT_SIZE:
+            return _tiny_forecast(historical_data, periods)
         
-        return {
-            "method": "가중 평균 (선형회귀 + 이동평균)",
-            "forecast": forecast,  # 이미 Python float 리스트
-            "confidence": confidence,
-            "confidence_score": float(round(overall_confidence, 3))  # numpy 타입 방지
-        } 
\ No newline at end of file
+        # 소규모 경로(_tiny_forecast)와 같이 숫자가 아닌 값은 TypeError (nan으로 바꾸지 않음)
+        return _forecast_cached(_as_key([float(v) for v in historical_data]), periods)
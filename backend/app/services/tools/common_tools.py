@@ -1,23 +1,24 @@
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from typing import Annotated
+from typing import Annotated, Tuple
+from functools import lru_cache
+from collections import OrderedDict
+import threading
+import hashlib
 import requests
 import json
+import os
 from dotenv import load_dotenv
 
+from .._http import get_http_client
+from .._rate_limit import LLM_RATE_LIMIT
+
 load_dotenv()
 
-@tool
-def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -> str:
-    """작성된 문서 내용이 회사 규정을 위반하는지 LLM과 OpenSearch를 통해 검사합니다."""
-    
-    try:
-        # 1단계: LLM을 사용해 규정 확인이 필요한 문구 추출
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
-        
-        extraction_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
+# 프롬프트는 호출마다 다시 만들지 않도록 모듈 로드 시 한 번만 구성합니다.
+_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
 아래 규칙을 지키면서 행위 단위로 판단 가능한 문구들을 추출해주세요.
 
 - 행위 단위란 시간, 장소, 인물, 행위, 목적, 결과, 비용 등이 하나의 사건처럼 묶여 기술된 문장 또는 절을 의미합니다.
@@ -39,11 +40,172 @@ def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -
              출력 예시:
 
 
-            """),
-            ("human", "{content}")
-        ])
+    """),
+    ("human", "{content}")
+])
+
+_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+다음 문구가 제공된 회사 규정을 위반하는지 분석해주세요.
+
+분석 기준:
+1. 명확하게 규정 위반이 있는지 확인
+2. 위반 문제가 있어보이는 것도 위반여부 반드시 확인
+
+응답 형식:
+- 위반이나 문제가 없으면: "OK"
+- 문제가 있으면: 구체적인 위반 내용을 간단히 설명
+    """),
+    ("human", "확인할 문구: {phrase}\n\n관련 규정 정보:\n{regulations}")
+])
+
+_CONVERSION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+주어진 구조화된 데이터를 자연스러운 한국어 문장으로 변환해주세요.
+
+변환 규칙:
+1. 모든 정보를 빠짐없이 포함해야 합니다
+2. 자연스럽고 읽기 쉬운 문장으로 작성해주세요
+3. 구어체 형태로 변환해주세요 (예: ~이야, ~야, ~음, ~지)
+4. 논리적인 순서로 정보를 배치해주세요
+5. 날짜, 연락처, 사이트 등의 정확한 정보는 그대로 유지해주세요
+
+예시 변환:
+입력: {{"방문제목": "ABC병원 방문", "방문날짜": "240101", "Client": "ABC병원"}}
+출력: 방문 제목은 ABC병원 방문이고 방문일은 240101이고 client는 ABC병원이야
+
+한 문단으로 자연스럽게 연결된 문장을 작성해주세요.
+    """),
+    ("human", "다음 구조화된 데이터를 자연스러운 원문으로 변환해주세요:\n\n{data}")
+])
+
+_SEPARATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """
+사용자가 입력한 텍스트를 분석하여 문서 양식 분류와 관련된 내용과 실제 문서에 들어갈 내용을 분리해주세요.
+
+분리 기준:
+1. 문서 양식 분류: "~을/를 작성할거야", "~서류를 만들어줘", "~계획서 작성", "~보고서 준비" 등 문서의 종류나 형태를 명시하는 부분
+2. 문서 내용: 실제 문서에 포함될 구체적인 정보, 데이터, 내용
+
+응답 형식은 JSON으로 반환해주세요:
+{{
+    "document_type": "문서 양식 분류 관련 내용",
+    "content": "문서에 들어갈 실제 내용"
+}}
+
+예시:
+입력: "제품설명회 계획서를 작성할거야. 25년 7월 25일에 제품설명회가 시행되며..."
+출력: {{
+    "document_type": "제품설명회 계획서를 작성할거야",
+    "content": "25년 7월 25일에 제품설명회가 시행되며..."
+}}
+
+만약 문서 양식 분류 부분이 명확하지 않다면 document_type을 빈 문자열로, 
+문서 내용이 없다면 content를 빈 문자열로 설정해주세요.
+    """),
+    ("human", "{user_input}")
+])
+
+@lru_cache(maxsize=None)
+def _get_llm(model: str, temperature: float) -> ChatOpenAI:
+    """모델/온도 조합별 ChatOpenAI 클라이언트를 한 번만 생성하여 재사용합니다. (연결 풀은 에이전트와 공유)"""
+    return ChatOpenAI(model=model, temperature=temperature, http_client=get_http_client())
+
+# 같은 본문의 규정 검사 결과 캐시 (용량 초과 시 먼저 들어온 항목부터 제거)
+_POLICY_CACHE_MAXSIZE = 256
+_POLICY_CACHE_TTL_SECONDS = 3600
+_policy_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_policy_cache_lock = threading.Lock()
+_policy_redis = None
+_policy_redis_checked = False
+
+def _get_policy_redis():
+    """POLICY_CHECK_REDIS_URL이 설정된 경우 Redis 클라이언트 반환 (미설정/연결 실패 시 None)"""
+    global _policy_redis, _policy_redis_checked
+    if _policy_redis_checked:
+        return _policy_redis
+    
+    _policy_redis_checked = True
+    url = os.getenv("POLICY_CHECK_REDIS_URL")
+    if url:
+        try:
+            import redis
+            _policy_redis = redis.Redis.from_url(url, socket_timeout=1)
+            _policy_redis.ping()
+        except Exception as e:
+            print(f"[WARNING] 규정 검사 Redis 캐시 연결 실패 - 프로세스 내 캐시만 사용: {e}")
+            _policy_redis = None
+    return _policy_redis
+
+def _cached_policy_result(key: bytes):
+    """프로세스 내 캐시 → Redis 순으로 규정 검사 결과 조회"""
+    with _policy_cache_lock:
+        if key in _policy_cache:
+            return _policy_cache[key]
+    
+    client = _get_policy_redis()
+    if client is None:
+        return None
+    
+    try:
+        value = client.get(f"viol:{key.hex()}")
+    except Exception as e:
+        print(f"[WARNING] 규정 검사 Redis 캐시 조회 실패: {e}")
+        return None
+    if value is None:
+        return None
+    
+    result = value.decode("utf-8")
+    _store_policy_result(key, result, redis_write=False)
+    return result
+
+def _store_policy_result(key: bytes, result: str, redis_write: bool = True):
+    """규정 검사 결과 저장 (FIFO 제거)"""
+    with _policy_cache_lock:
+        _policy_cache[key] = result
+        if len(_policy_cache) > _POLICY_CACHE_MAXSIZE:
+            _policy_cache.popitem(last=False)
+    
+    client = _get_policy_redis() if redis_write else None
+    if client is not None:
+        try:
+            client.setex(f"viol:{key.hex()}", _POLICY_CACHE_TTL_SECONDS, result)
+        except Exception as e:
+            print(f"[WARNING] 규정 검사 Redis 캐시 저장 실패: {e}")
+
+@tool
+def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -> str:
+    """작성된 문서 내용이 회사 규정을 위반하는지 LLM과 OpenSearch를 통해 검사합니다."""
+    
+    # 같은 본문은 문구 추출 LLM 호출과 규정 검색을 반복하지 않음
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    cached = _cached_policy_result(key)
+    if cached is not None:
+        print("[CACHE] 동일 본문 규정 검사 결과 재사용")
+        return cached
+    
+    result, cacheable = _check_policy_violation_uncached(content)
+    if cacheable:
+        _store_policy_result(key, result)
+    return result
+
+def _check_policy_violation_uncached(content: str) -> Tuple[str, bool]:
+    """
+    check_policy_violation 본체 (캐시 미적중 시 실행)
+    
+    Returns:
+        Tuple[str, bool]: (검사 결과, 캐시 가능 여부)
+            - LLM/API 호출 실패나 추출 결과 파싱 실패가 섞인 결과는 일시적 실패로 보고 캐시하지 않음
+    """
+    cacheable = True
+    
+    try:
+        # 1단계: LLM을 사용해 규정 확인이 필요한 문구 추출
+        llm = _get_llm("gpt-4o", 0.7)
+        
+        LLM_RATE_LIMIT.wait()
         
-        response = llm.invoke(extraction_prompt.format_messages(content=content))
+        response = llm.invoke(_EXTRACTION_PROMPT.format_messages(content=content))
         extracted_text = response.content.strip()
         
         print(f"[LLM] 문구 추출 결과: {extracted_text}")
@@ -54,14 +216,17 @@ def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -
                 policy_phrases = json.loads(extracted_text)
             else:
                 # JSON 형태가 아닌 경우 빈 리스트로 처리
+                print("[WARNING] 문구 추출 결과가 JSON 배열이 아님, 빈 리스트로 처리")
                 policy_phrases = []
+                cacheable = False
         except json.JSONDecodeError:
             print("[WARNING] JSON 파싱 실패, 빈 리스트로 처리")
             policy_phrases = []
+            cacheable = False
         
         if not policy_phrases:
             print("[OK] 규정 확인이 필요한 문구가 발견되지 않았습니다.")
-            return "OK"
+            return "OK", cacheable
         
         print(f"[SEARCH] 추출된 규정 확인 대상 문구: {policy_phrases}")
         
@@ -93,23 +258,28 @@ def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -
                         print(f"[RESULT] '{phrase}' 검색 결과: {len(search_results)}개")
                         
                         # 3단계: LLM을 사용해 추출된 규정 정보와 비교하여 위반 여부 판단
-                        violation_result = _check_phrase_against_regulations(phrase, search_results, llm)
+                        violation_result, phrase_cacheable = _check_phrase_against_regulations(phrase, search_results, llm)
+                        cacheable = cacheable and phrase_cacheable
                         if violation_result != "OK":
                             violations.append(f"{phrase}: {violation_result}")
                     else:
                         print(f"[WARNING] API 응답 실패 ({phrase}): {api_result}")
                         violations.append(f"{phrase}: API 응답 오류")
+                        cacheable = False
                         
                 else:
                     print(f"[WARNING] FastAPI 호출 실패 ({phrase}): {response.status_code}")
                     violations.append(f"{phrase}: 규정 검색 실패 (HTTP {response.status_code})")
+                    cacheable = False
                     
             except requests.exceptions.RequestException as e:
                 print(f"[WARNING] API 호출 오류 ({phrase}): {e}")
                 violations.append(f"{phrase}: 네트워크 오류로 규정 확인 불가")
+                cacheable = False
             except Exception as e:
                 print(f"[WARNING] 처리 중 오류 ({phrase}): {e}")
                 violations.append(f"{phrase}: 처리 오류 - {str(e)}")
+                cacheable = False
         
         # 최종 결과 반환
         actual_violations = []
@@ -119,20 +289,25 @@ def check_policy_violation(content: Annotated[str, "작성된 문서 본문"]) -
                 actual_violations.append(violation)
         
         if actual_violations:
-            return " | ".join(actual_violations)
+            return " | ".join(actual_violations), cacheable
         else:
-            return "OK"
+            return "OK", cacheable
             
     except Exception as e:
         print(f"[ERROR] 규정 검사 중 오류 발생: {e}")
-        return f"규정 검사 오류: {str(e)}"
+        return f"규정 검사 오류: {str(e)}", False
 
-def _check_phrase_against_regulations(phrase: str, search_results: list, llm: ChatOpenAI) -> str:
-    """추출된 문구를 규정 정보와 비교하여 위반 여부를 판단합니다."""
+def _check_phrase_against_regulations(phrase: str, search_results: list, llm: ChatOpenAI) -> Tuple[str, bool]:
+    """
+    추출된 문구를 규정 정보와 비교하여 위반 여부를 판단합니다.
+    
+    Returns:
+        Tuple[str, bool]: (판단 결과, 캐시 가능 여부) - LLM 호출 실패 시 캐시하지 않음
+    """
     
     try:
         if not search_results:
-            return "관련 규정 정보를 찾을 수 없습니다"
+            return "관련 규정 정보를 찾을 수 없습니다", True
         
         # 상위 3개 결과만 사용 (너무 많은 정보 방지)
         top_results = search_results[:3]
@@ -152,22 +327,8 @@ def _check_phrase_against_regulations(phrase: str, search_results: list, llm: Ch
         # 응답 형식:
         # - 위반이나 문제가 없으면: "OK"
         # - 문제가 있으면: 구체적인 위반 내용을 간단히 설명
-        validation_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-다음 문구가 제공된 회사 규정을 위반하는지 분석해주세요.
-
-분석 기준:
-1. 명확하게 규정 위반이 있는지 확인
-2. 위반 문제가 있어보이는 것도 위반여부 반드시 확인
-
-응답 형식:
-- 위반이나 문제가 없으면: "OK"
-- 문제가 있으면: 구체적인 위반 내용을 간단히 설명
-            """),
-            ("human", "확인할 문구: {phrase}\n\n관련 규정 정보:\n{regulations}")
-        ])
-        
-        response = llm.invoke(validation_prompt.format_messages(
+        LLM_RATE_LIMIT.wait()
+        response = llm.invoke(_VALIDATION_PROMPT.format_messages(
             phrase=phrase, 
             regulations=regulations_text
         ))
@@ -175,11 +336,11 @@ def _check_phrase_against_regulations(phrase: str, search_results: list, llm: Ch
         result = response.content.strip()
         print(f"[CHECK] '{phrase}' 규정 검사 결과: {result[:100]}{'...' if len(result) > 100 else ''}")
         
-        return result
+        return result, True
         
     except Exception as e:
         print(f"[WARNING] 규정 비교 중 오류: {e}")
-        return f"규정 비교 오류: {str(e)}"
+        return f"규정 비교 오류: {str(e)}", False
 
 @tool
 def convert_structured_to_natural_text(structured_data: Annotated[str, "JSON 형태의 구조화된 데이터"]) -> str:
@@ -197,32 +358,14 @@ def convert_structured_to_natural_text(structured_data: Annotated[str, "JSON 형
             return f"데이터 파싱 오류: {str(e)}"
         
         # LLM을 사용해 자연스러운 문장으로 변환
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.3)
-        
-        conversion_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-주어진 구조화된 데이터를 자연스러운 한국어 문장으로 변환해주세요.
-
-변환 규칙:
-1. 모든 정보를 빠짐없이 포함해야 합니다
-2. 자연스럽고 읽기 쉬운 문장으로 작성해주세요
-3. 구어체 형태로 변환해주세요 (예: ~이야, ~야, ~음, ~지)
-4. 논리적인 순서로 정보를 배치해주세요
-5. 날짜, 연락처, 사이트 등의 정확한 정보는 그대로 유지해주세요
-
-예시 변환:
-입력: {{"방문제목": "ABC병원 방문", "방문날짜": "240101", "Client": "ABC병원"}}
-출력: 방문 제목은 ABC병원 방문이고 방문일은 240101이고 client는 ABC병원이야
-
-한 문단으로 자연스럽게 연결된 문장을 작성해주세요.
-            """),
-            ("human", "다음 구조화된 데이터를 자연스러운 원문으로 변환해주세요:\n\n{data}")
-        ])
+        llm = _get_llm("gpt-4o", 0.3)
         
         # 데이터를 문자열 형태로 변환
         data_str = str(data) if not isinstance(data, str) else data
         
-        response = llm.invoke(conversion_prompt.format_messages(data=data_str))
+        LLM_RATE_LIMIT.wait()
+        
+        response = llm.invoke(_CONVERSION_PROMPT.format_messages(data=data_str))
         natural_text = response.content.strip()
         
         print(f"[CONVERT] 구조화된 데이터 -> 자연어 변환 완료")
@@ -239,36 +382,11 @@ def separate_document_type_and_content(user_input: Annotated[str, "사용자가
     """사용자 입력에서 문서 양식 분류와 관련된 내용과 문서 양식에 들어갈 내용을 분리합니다."""
     
     try:
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.1)
+        llm = _get_llm("gpt-4o", 0.1)
         
-        separation_prompt = ChatPromptTemplate.from_messages([
-            ("system", """
-사용자가 입력한 텍스트를 분석하여 문서 양식 분류와 관련된 내용과 실제 문서에 들어갈 내용을 분리해주세요.
-
-분리 기준:
-1. 문서 양식 분류: "~을/를 작성할거야", "~서류를 만들어줘", "~계획서 작성", "~보고서 준비" 등 문서의 종류나 형태를 명시하는 부분
-2. 문서 내용: 실제 문서에 포함될 구체적인 정보, 데이터, 내용
-
-응답 형식은 JSON으로 반환해주세요:
-{{
-    "document_type": "문서 양식 분류 관련 내용",
-    "content": "문서에 들어갈 실제 내용"
-}}
-
-예시:
-입력: "제품설명회 계획서를 작성할거야. 25년 7월 25일에 제품설명회가 시행되며..."
-출력: {{
-    "document_type": "제품설명회 계획서를 작성할거야",
-    "content": "25년 7월 25일에 제품설명회가 시행되며..."
-}}
-
-만약 문서 양식 분류 부분이 명확하지 않다면 document_type을 빈 문자열로, 
-문서 내용이 없다면 content를 빈 문자열로 설정해주세요.
-            """),
-            ("human", "{user_input}")
-        ])
+        LLM_RATE_LIMIT.wait()
         
-        response = llm.invoke(separation_prompt.format_messages(user_input=user_input))
+        response = llm.invoke(_SEPARATION_PROMPT.format_messages(user_input=user_input))
         result = response.content.strip()
         
         print(f"[SEPARATE] 문서 분류 및 내용 분리 결과: {result}")
@@ -0,0 +1,88 @@
+"""
+pytest 공용 설정
+에이전트 생성 비용(템플릿 로드, LLM 클라이언트 초기화, 그래프 컴파일)을
+세션당 한 번만 치르도록 공용 fixture를 제공합니다.
+"""
+import os
+import zlib
+
+import pytest
+
+# import 경로: backend는 pyproject.toml의 pythonpath 설정으로 추가되고("from app.services..."),
+# test 디렉토리는 pytest가 이 conftest를 로드할 때 추가합니다("from conftest import ...", "from fixtures...").
+
+
+class TestColors:
+    """테스트 출력용 색상"""
+    __test__ = False  # pytest가 테스트 클래스로 수집하지 않도록 함
+    
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+
+# 분류 질문을 나눌 워커 그룹 수 (pytest -n 8 --dist=loadgroup 기준)
+QUERY_GROUPS = 8
+
+
+def pytest_configure(config):
+    """xdist 미설치 환경에서도 경고가 나지 않도록 마커 등록"""
+    config.addinivalue_line("markers", "xdist_group(name): pytest-xdist loadgroup 분배 그룹")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    "query" 파라미터가 있는 테스트를 질문 앞부분 해시 순으로 정렬하고 같은 워커 그룹으로 묶습니다.
+    앞부분이 같은 질문이 같은 워커에서 연달아 실행되어 LLM 서버의 프롬프트 캐시 적중률이 올라갑니다.
+    (hash()는 프로세스마다 달라지므로 crc32 사용)
+    """
+    positions = []
+    query_items = []
+    for index, item in enumerate(items):
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "query" in callspec.params:
+            positions.append(index)
+            query_items.append(item)
+
+    def prefix_hash(item):
+        return zlib.crc32(item.callspec.params["query"][:8].encode("utf-8"))
+
+    query_items.sort(key=prefix_hash)
+    for index, item in zip(positions, query_items):
+        item.add_marker(pytest.mark.xdist_group(name=f"query-{prefix_hash(item) % QUERY_GROUPS}"))
+        items[index] = item
+
+
+def _require_openai_key():
+    """LLM을 호출하는 fixture는 API 키가 없으면 실패 대신 건너뜀"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    if not os.getenv("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY가 설정되지 않아 LLM 테스트를 건너뜁니다.")
+
+
+@pytest.fixture(scope="session")
+def router():
+    """세션 공용 RouterAgent"""
+    _require_openai_key()
+    from app.services.router_agent import RouterAgent
+    return RouterAgent()
+
+
+@pytest.fixture(scope="session")
+def agent():
+    """세션 공용 CreateDocumentAgent"""
+    _require_openai_key()
+    from app.services.docs_agent.create_document_agent import CreateDocumentAgent
+    return CreateDocumentAgent()
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """세션 공용 AgentClassifier"""
+    _require_openai_key()
+    from app.services.router_agent.classifier import AgentClassifier
+    return AgentClassifier()
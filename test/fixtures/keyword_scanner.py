@@ -0,0 +1,112 @@
+"""
+테스트용 다중 키워드 스캐너
+여러 키워드를 한 번의 스캔으로 찾습니다. 사용 가능한 엔진을 자동 선택합니다.
+(hyperscan → pyahocorasick → 부분 문자열 검사)
+
+모든 엔진은 같은 결과를 반환합니다.
+- find_all: 본문에 포함된 항목 집합
+- first: 본문에서 가장 앞에 시작하는 항목 (같은 위치면 목록 앞쪽 항목)
+"""
+import re
+
+BACKENDS = ("hyperscan", "ahocorasick", "substring")
+
+
+class _SubstringScanner:
+    """부분 문자열 검사 (의존성 없음, 다른 엔진 결과 비교 기준)"""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    def find_all(self, content: str, encoded: bytes = None) -> set:
+        return {entry for entry in self.entries if entry[1] in content}
+
+    def first(self, content: str, encoded: bytes = None):
+        found = [(content.find(entry[1]), i) for i, entry in enumerate(self.entries) if entry[1] in content]
+        return self.entries[min(found)[1]] if found else None
+
+
+class _AhoCorasickScanner:
+    """pyahocorasick 오토마톤 (본문 길이에 비례하는 단일 스캔)"""
+
+    def __init__(self, entries):
+        import ahocorasick
+
+        self.entries = list(entries)
+        self._automaton = ahocorasick.Automaton()
+        for i, entry in enumerate(self.entries):
+            self._automaton.add_word(entry[1], i)
+        self._automaton.make_automaton()
+
+    def _matches(self, content: str):
+        """(시작 위치, 항목 인덱스) 목록 - 오토마톤은 끝 위치를 반환하므로 시작 위치로 환산"""
+        return [(end - len(self.entries[i][1]) + 1, i) for end, i in self._automaton.iter(content)]
+
+    def find_all(self, content: str, encoded: bytes = None) -> set:
+        return {self.entries[i] for _, i in self._matches(content)}
+
+    def first(self, content: str, encoded: bytes = None):
+        matches = self._matches(content)
+        return self.entries[min(matches)[1]] if matches else None
+
+
+class _HyperscanScanner:
+    """hyperscan 데이터베이스 (SIMD 가속, UTF-8 바이트 단위 스캔)"""
+
+    def __init__(self, entries):
+        import hyperscan
+
+        self.entries = list(entries)
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[re.escape(keyword).encode("utf-8") for _, keyword in self.entries],
+            ids=list(range(len(self.entries))),
+            elements=len(self.entries),
+            flags=[hyperscan.HS_FLAG_UTF8] * len(self.entries)
+        )
+        self._lengths = [len(keyword.encode("utf-8")) for _, keyword in self.entries]
+
+    def _matches(self, content: str, encoded: bytes = None):
+        """(시작 바이트 위치, 항목 인덱스) 목록"""
+        matches = []
+        self._db.scan(
+            encoded if encoded is not None else content.encode("utf-8"),
+            match_event_handler=lambda pattern_id, start, end, flags, context:
+                matches.append((end - self._lengths[pattern_id], pattern_id))
+        )
+        return matches
+
+    def find_all(self, content: str, encoded: bytes = None) -> set:
+        return {self.entries[i] for _, i in self._matches(content, encoded)}
+
+    def first(self, content: str, encoded: bytes = None):
+        matches = self._matches(content, encoded)
+        return self.entries[min(matches)[1]] if matches else None
+
+
+_SCANNERS = {
+    "hyperscan": _HyperscanScanner,
+    "ahocorasick": _AhoCorasickScanner,
+    "substring": _SubstringScanner,
+}
+
+
+def build_scanner(entries, backend: str = None):
+    """
+    (분류, 키워드) 목록으로 스캐너 생성
+
+    Args:
+        entries: (분류, 키워드) 튜플 목록
+        backend: BACKENDS 중 하나 (None이면 설치된 엔진 중 가장 빠른 것)
+
+    Raises:
+        ImportError: 지정한 엔진의 패키지가 설치되어 있지 않은 경우
+    """
+    if backend is not None:
+        return _SCANNERS[backend](entries)
+
+    for name in BACKENDS:
+        try:
+            return _SCANNERS[name](entries)
+        except ImportError:
+            continue
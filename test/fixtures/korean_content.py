@@ -0,0 +1,22 @@
+"""
+테스트 공용 한국어 본문
+여러 테스트에서 반복되던 요청 문구를 한 곳에 모읍니다.
+키워드 스캐너(hyperscan)에 바로 넘길 수 있도록 UTF-8 인코딩 결과도 함께 제공합니다. (*_UTF8)
+"""
+
+# 규정 위반(로얄티, 메리트, 자사 판촉물)이 포함된 영업방문 결과보고서 요청 (전체 필드)
+YUMI_VISIT_REPORT = """영업방문결과서 작성해줘. 내용은 방문 제목은 유미가정의학과 신약 홍보이고 
+    방문일은 250725이고 client는 유미가정의학과 방문사이트는 www.yumibanplz.com 
+    담담자는 손현성이고 소속은 영업팀 연락처는 010-1234-5678이야 
+    영업제공자는 김도윤이고 연락처는 010-8765-4321이야 
+    방문자는 허한결이고 소속은 영업팀이야 
+    고객사 개요는 이번에 새로 오픈한 가정의학과로 사용 약품에 대해 많은 논의가 필요해보이는 잠재력이 있는 고객이야 
+    프로젝트 개요는 신규고객 유치로 자사 약품홍보 후 로얄티 및 메리트 소개를 할거야 
+    방문 및 협의 내용은 자사 약품 소개와 로얄티 및 자사 약품 사용시 메리트를 소개하였음 
+    향후계획및일정은 7월 27일에 다시 방문하여 자사 판촉물 전달과 로얄티 협상을 할 예정이야 
+    협조사항으로 자사 판촉물 1개 지급 요망"""
+YUMI_VISIT_REPORT_UTF8 = YUMI_VISIT_REPORT.encode("utf-8")
+
+# 규정 위반이 포함된 짧은 영업방문 결과보고서 요청
+SHORT_LOYALTY_REQUEST = """영업방문결과서 작성해줘. 향후계획은 7월 27일에 다시 방문하여 자사 판촉물 전달과 로얄티 협상을 할 예정이야"""
+SHORT_LOYALTY_REQUEST_UTF8 = SHORT_LOYALTY_REQUEST.encode("utf-8")
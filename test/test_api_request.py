@@ -2,15 +2,22 @@
 API 테스트 스크립트
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 # API 엔드포인트
 BASE_URL = "http://localhost:8000"
 
+# 연결 재사용 (keep-alive) 세션
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.headers.update({"Content-Type": "application/json"})
+
 def test_health_check():
     """헬스 체크 테스트"""
     print("=== 헬스 체크 테스트 ===")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}")
     print()
@@ -31,7 +38,7 @@ def test_chat_api():
     print(f"Payload: {json.dumps(payload, ensure_ascii=False)}")
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -70,7 +77,7 @@ def test_resume_api(session_id, user_reply="예"):
     print(f"User Reply: {user_reply}")
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
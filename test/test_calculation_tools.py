@@ -0,0 +1,56 @@
+"""
+실적 계산 도구 입력 검증 테스트
+숫자가 아닌 값(None)이 float64 변환 중 nan으로 바뀌어 그럴듯한 결과를 내지 않는지,
+그리고 입력 길이(소규모 경로 / 캐시 경로)와 관계없이 같은 방식으로 처리되는지 확인합니다.
+"""
+import sys
+
+import pytest
+
+from app.services.tools.calculation_tools import PerformanceCalculationTools as tools
+
+# 소규모 경로(8개 이하)와 배열 캐시 경로(9개 이상) 모두 검사
+SERIES_WITH_NONE = [
+    pytest.param([1, 2, None, 4, 5], id="tiny"),
+    pytest.param([1, 2, 3, 4, 5, 6, 7, 8, 9, None], id="large"),
+]
+
+@pytest.mark.parametrize("amounts", SERIES_WITH_NONE)
+def test_trend_analysis_none_fails(amounts):
+    assert tools.calculate_trend_analysis(amounts)["trend"] == "분석 실패"
+
+@pytest.mark.parametrize("amounts", SERIES_WITH_NONE)
+def test_variance_analysis_none_fails(amounts):
+    assert tools.calculate_variance_analysis(amounts)["stability"] == "분석 실패"
+
+@pytest.mark.parametrize("historical_data", SERIES_WITH_NONE)
+def test_forecast_none_raises(historical_data):
+    with pytest.raises(TypeError):
+        tools.calculate_forecast(historical_data)
+
+@pytest.mark.parametrize("x_values", SERIES_WITH_NONE)
+def test_correlation_none_raises(x_values):
+    y_values = list(range(len(x_values)))
+    with pytest.raises(TypeError):
+        tools.calculate_correlation_analysis(x_values, y_values)
+    with pytest.raises(TypeError):
+        tools.calculate_correlation_analysis(y_values, x_values)
+
+def test_pareto_none_raises():
+    with pytest.raises(TypeError):
+        tools.calculate_pareto_analysis([{"amount": 10}, {"amount": None}, {"amount": 5}])
+
+def test_seasonal_none_raises():
+    monthly_data = [{"month": f"2024{m:02d}", "amount": None if m == 3 else m * 100} for m in range(1, 7)]
+    with pytest.raises(TypeError):
+        tools.calculate_seasonal_analysis(monthly_data)
+
+def test_pareto_negative_total_keeps_percentages():
+    """합계가 음수여도 합계 대비 누적 비율을 계산 (기존 정렬 기반 구현과 동일)"""
+    result = tools.calculate_pareto_analysis([{"amount": -5}, {"amount": -1}, {"amount": -2}])
+    
+    assert [c["cumulative_percent"] for c in result["cumulative_contribution"]] == [12.5, 37.5, 100.0]
+    assert result["pareto_point"] == 3
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -1,17 +1,15 @@
 """
 CreateDocumentAgent 직접 테스트
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.services.docs_agent.create_document_agent import CreateDocumentAgent
 
-from backend.app.services.docs_agent.create_document_agent import CreateDocumentAgent
+from fixtures.korean_content import SHORT_LOYALTY_REQUEST
 
 def test_create_agent():
     """CreateDocumentAgent 직접 테스트"""
     
     # 테스트 내용
-    test_content = """영업방문결과서 작성해줘. 향후계획은 7월 27일에 다시 방문하여 자사 판촉물 전달과 로얄티 협상을 할 예정이야"""
+    test_content = SHORT_LOYALTY_REQUEST
     
     print("=== CreateDocumentAgent 직접 테스트 ===\n")
     
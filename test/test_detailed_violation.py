@@ -1,13 +1,32 @@
 """
 상세한 규정 위반 검사 테스트
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+# 연결 재사용 (keep-alive) 세션
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+FASTAPI_URL = "http://localhost:8010/qa/question"
+
+def _search_phrase(phrase):
+    """문구 하나를 검색하고 (응답, 오류) 를 반환"""
+    payload = {
+        "question": phrase,
+        "top_k": 5,
+        "include_summary": True,
+        "include_sources": True
+    }
+    
+    try:
+        return SESSION.post(FASTAPI_URL, json=payload, timeout=30), None
+    except Exception as e:
+        return None, e
+
 def test_fastapi_direct():
     """FastAPI 직접 호출 테스트"""
     print("=== FastAPI 직접 호출 테스트 ===\n")
@@ -18,26 +37,18 @@ def test_fastapi_direct():
         "자사 약품 사용시 메리트 소개"
     ]
     
-    fastapi_url = "http://localhost:8010/qa/question"
+    # 서버 측이 I/O 대기 위주이므로 문구들을 동시에 요청
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_search_phrase, test_phrases))
     
-    for phrase in test_phrases:
+    for phrase, (response, error) in zip(test_phrases, results):
         print(f"\n검색 문구: '{phrase}'")
         
-        payload = {
-            "question": phrase,
-            "top_k": 5,
-            "include_summary": True,
-            "include_sources": True
-        }
+        if error is not None:
+            print(f"오류 발생: {error}")
+            continue
         
         try:
-            response = requests.post(
-                fastapi_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
             if response.status_code == 200:
                 result = response.json()
                 print(f"성공: {result.get('success')}")
@@ -59,7 +70,7 @@ def test_web_interface_violation():
     """WebInterface 규정 위반 검사 테스트"""
     print("\n\n=== WebInterface 규정 위반 검사 테스트 ===\n")
     
-    from backend.app.services.docs_agent.web_interface import WebDocumentAgent
+    from app.services.docs_agent.web_interface import WebDocumentAgent
     
     test_content = """영업방문결과서 작성해줘. 
     방문 및 협의 내용은 자사 약품 소개와 로얄티 및 자사 약품 사용시 메리트를 소개하였음 
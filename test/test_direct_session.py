@@ -1,18 +1,16 @@
 """
 직접 세션 테스트
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.services.docs_agent.web_interface import WebDocumentAgent
 
-from backend.app.services.docs_agent.web_interface import WebDocumentAgent
+from fixtures.korean_content import SHORT_LOYALTY_REQUEST
 
 def test_direct_session():
     web_agent = WebDocumentAgent()
     session_id = 'test_direct'
     
     # 직접 세션 생성 및 테스트
-    content = '''영업방문결과서 작성해줘. 향후계획은 7월 27일에 다시 방문하여 자사 판촉물 전달과 로얄티 협상을 할 예정이야'''
+    content = SHORT_LOYALTY_REQUEST
     
     print("=== 직접 세션 테스트 ===\n")
     print(f"테스트 내용: {content}\n")
@@ -3,54 +3,52 @@ docs_agent 직접 상호작용 테스트
 CreateDocumentAgent를 직접 호출하여 문서 생성 프로세스를 테스트합니다.
 """
 import sys
-from pathlib import Path
 import json
 
-# 경로 설정
-current_file = Path(__file__).resolve()
-test_dir = current_file.parent
-project_root = test_dir.parent
-backend_dir = project_root / "backend"
+import pytest
 
-# backend를 Python 경로에 추가
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-print(f"[PATH] Added to sys.path: {backend_dir}")
 
-# CreateDocumentAgent import
-from app.services.docs_agent.create_document_agent import CreateDocumentAgent
+def _dump(obj):
+    """디버그 출력용 JSON 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
 
 
-def test_create_document_agent_init():
+@pytest.fixture(scope="module")
+def thread_id(agent):
+    """run 테스트 케이스 중 인터럽트가 발생한 스레드 ID"""
+    return _run_cases(agent)
+
+
+def test_create_document_agent_init(agent):
     """CreateDocumentAgent 초기화 테스트"""
     print("\n=== CreateDocumentAgent 초기화 테스트 ===")
+    print("[OK] CreateDocumentAgent 인스턴스 생성 성공")
     
-    try:
-        agent = CreateDocumentAgent()
-        print("[OK] CreateDocumentAgent 인스턴스 생성 성공")
-        
-        # 속성 확인
-        print(f"  - Model: {agent.model_name}")
-        print(f"  - Temperature: {agent.temperature}")
-        print(f"  - Templates loaded: {len(agent.doc_prompts)} types")
-        
-        if agent.doc_prompts:
-            print("  - Available document types:")
-            for doc_type in agent.doc_prompts.keys():
-                print(f"    - {doc_type}")
-                
-        return agent
-        
-    except Exception as e:
-        print(f"[ERROR] 초기화 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+    # 속성 확인
+    print(f"  - Model: {agent.model_name}")
+    print(f"  - Temperature: {agent.temperature}")
+    print(f"  - Templates loaded: {len(agent.doc_prompts)} types")
+    
+    if agent.doc_prompts:
+        print("  - Available document types:")
+        for doc_type in agent.doc_prompts.keys():
+            print(f"    - {doc_type}")
 
 
 def test_run_method(agent):
     """run 메서드 테스트"""
+    _run_cases(agent)
+
+
+def _run_cases(agent):
+    """run 메서드 테스트 케이스 실행 후 인터럽트된 스레드 ID 반환"""
     print("\n=== run 메서드 테스트 ===")
     
     test_cases = [
@@ -97,9 +95,7 @@ def test_run_method(agent):
                 return result['thread_id']  # 다음 테스트를 위해 thread_id 반환
                 
         except Exception as e:
-            print(f"[ERROR] 실행 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            pytest.fail(f"run 실행 실패 ({test['name']}): {e}")
             
     return None
 
@@ -154,9 +150,7 @@ def test_resume_method(agent, thread_id):
             print(f"  - Current State: {inner_result.get('current_step', 'N/A')}")
             
     except Exception as e:
-        print(f"[ERROR] Resume 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        pytest.fail(f"Resume 실패: {e}")
 
 
 def test_interactive_flow(agent):
@@ -207,9 +201,7 @@ def test_interactive_flow(agent):
                     print(f"  [ERROR] 오류 발생: {result.get('error')}")
                     
     except Exception as e:
-        print(f"[ERROR] 대화형 흐름 테스트 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        pytest.fail(f"대화형 흐름 테스트 실패: {e}")
 
 
 def test_direct_node_methods(agent):
@@ -233,7 +225,7 @@ def test_direct_node_methods(agent):
         print(f"  - Classification Failed: {new_state.get('classification_failed')}")
         print("  [OK] 분류 성공")
     except Exception as e:
-        print(f"  [ERROR] 분류 실패: {e}")
+        pytest.fail(f"classify_doc_type 분류 실패: {e}")
         
     # 2. parse_user_input 테스트
     print("\n2. parse_user_input 메서드")
@@ -247,46 +239,13 @@ def test_direct_node_methods(agent):
     try:
         new_state = agent.parse_user_input(state)
         if new_state.get('filled_data'):
-            print(f"  - Parsed Data: {json.dumps(new_state['filled_data'], ensure_ascii=False, indent=2)}")
+            print(f"  - Parsed Data: {_dump(new_state['filled_data'])}")
             print("  [OK] 파싱 성공")
         else:
             print("  [ERROR] 파싱 실패")
     except Exception as e:
-        print(f"  [ERROR] 파싱 오류: {e}")
-
-
-def main():
-    """메인 테스트 실행"""
-    print("="*60)
-    print("docs_agent 직접 상호작용 테스트")
-    print("="*60)
-    
-    # 1. 초기화 테스트
-    agent = test_create_document_agent_init()
-    
-    if agent:
-        # 2. run 메서드 테스트
-        thread_id = test_run_method(agent)
-        
-        # 3. resume 메서드 테스트
-        if thread_id:
-            test_resume_method(agent, thread_id)
-        
-        # 4. 대화형 흐름 테스트
-        test_interactive_flow(agent)
-        
-        # 5. 개별 노드 메서드 테스트
-        test_direct_node_methods(agent)
-    
-    print("\n" + "="*60)
-    print("테스트 완료")
-    print("="*60)
-    
-    print("\n참고:")
-    print("- 삭제된 web_interface.py 없이도 CreateDocumentAgent가 정상 작동합니다")
-    print("- RouterAgent는 CreateDocumentAgent를 직접 import하여 사용합니다")
-    print("- run()과 resume() 메서드로 대화형 문서 생성이 가능합니다")
+        pytest.fail(f"parse_user_input 파싱 오류: {e}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
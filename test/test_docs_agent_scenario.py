@@ -3,24 +3,21 @@
 실제 사용 케이스를 시뮬레이션하여 전체 워크플로우를 테스트합니다.
 """
 import sys
-from pathlib import Path
 import json
 
-# 경로 설정
-current_file = Path(__file__).resolve()
-test_dir = current_file.parent
-project_root = test_dir.parent
-backend_dir = project_root / "backend"
+import pytest
 
-# backend를 Python 경로에 추가
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-print(f"[PATH] Added to sys.path: {backend_dir}")
 
-# 필요한 모듈 import
-from app.services.router_agent import RouterAgent
-from app.services.docs_agent.create_document_agent import CreateDocumentAgent
+def _dump(obj):
+    """디버그 출력용 JSON 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
 
 
 def print_step(step_num, title):
@@ -30,14 +27,12 @@ def print_step(step_num, title):
     print('='*60)
 
 
-def test_full_scenario_with_router():
+def test_full_scenario_with_router(router):
     """Router를 통한 전체 시나리오 테스트"""
     print("\n" + "#"*70)
     print("# 시나리오: Router를 통한 영업방문 결과보고서 작성 (규정 위반 포함)")
     print("#"*70)
     
-    # RouterAgent 초기화
-    router = RouterAgent()
     session_id = "test-scenario-001"
     
     # STEP 1: 초기 요청
@@ -142,22 +137,18 @@ Client: 유미가정의학과
                         print("\n[WARNING] 규정 위반이 감지되지 않았습니다!")
                     else:
                         print("\n[ERROR] 예상치 못한 결과")
-                        print(f"Result: {json.dumps(inner_result, ensure_ascii=False, indent=2)}")
+                        print(f"Result: {_dump(inner_result)}")
         
     except Exception as e:
-        print(f"\n[ERROR] 테스트 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        pytest.fail(f"테스트 실패: {e}")
 
 
-def test_direct_docs_agent_scenario():
+def test_direct_docs_agent_scenario(agent):
     """CreateDocumentAgent 직접 호출 시나리오 테스트"""
     print("\n" + "#"*70)
     print("# 시나리오: CreateDocumentAgent 직접 호출 테스트")
     print("#"*70)
     
-    agent = CreateDocumentAgent()
-    
     # STEP 1: 초기 실행
     print_step(1, "초기 실행")
     
@@ -206,9 +197,7 @@ def test_direct_docs_agent_scenario():
                         print(f"\n[SUCCESS] 문서 생성 완료: {inner_result['final_doc']}")
                     
     except Exception as e:
-        print(f"\n[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+        pytest.fail(f"직접 호출 시나리오 실패: {e}")
 
 
 def test_violation_detection_only():
@@ -246,30 +235,5 @@ def test_violation_detection_only():
             print(f"[RESULT] 규정 위반 감지: {violation}")
 
 
-def main():
-    """메인 테스트 실행"""
-    print("="*70)
-    print("시나리오 기반 상호작용 테스트 시작")
-    print("="*70)
-    
-    # 1. Router를 통한 전체 시나리오 테스트
-    test_full_scenario_with_router()
-    
-    # 2. CreateDocumentAgent 직접 호출 테스트
-    test_direct_docs_agent_scenario()
-    
-    # 3. 규정 위반 감지 단독 테스트
-    test_violation_detection_only()
-    
-    print("\n" + "="*70)
-    print("시나리오 기반 상호작용 테스트 완료")
-    print("="*70)
-    
-    print("\n[참고사항]")
-    print("- 로얄티/메리트 언급 시 규정 위반이 감지되어야 합니다")
-    print("- 위반 감지 시 문서 생성이 중단되어야 합니다")
-    print("- 정상적인 내용은 문서가 생성되어야 합니다")
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
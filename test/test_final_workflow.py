@@ -2,11 +2,10 @@
 최종 워크플로우 테스트
 """
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import asyncio
-from backend.app.services.docs_agent.web_interface import WebDocumentAgent
+
+import pytest
+from app.services.docs_agent.web_interface import WebDocumentAgent
 
 async def test_complete_workflow():
     """전체 워크플로우 테스트"""
@@ -40,34 +39,46 @@ async def test_complete_workflow():
     
     web_agent = WebDocumentAgent()
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n{'='*50}")
-        print(f"테스트 {i}: {test_case['name']}")
-        print(f"{'='*50}\n")
-        
-        # 세션 생성
+    async def run_case(i, test_case):
+        """케이스 하나를 독립된 세션으로 실행 (동기 API는 스레드에서 실행)"""
         session_id = f"test_session_{i}"
         
         # 문서 생성 시작
-        result = web_agent.create_session(session_id, test_case['content'])
+        result = await asyncio.to_thread(web_agent.create_session, session_id, test_case['content'])
+        verification = None
         
         # 분류 확인
         if result.get('waiting_for_input') and result.get('input_type') == 'verification':
-            print(f"문서 분류: {result.get('doc_type')}")
-            print("분류 확인 응답: 예")
+            verification = result
             
             # 검증 응답
-            result = web_agent.process_user_input(session_id, "예")
-            
-            if result.get('success'):
-                print(f"\n결과: {result.get('message', '성공')}")
-                if result.get('document'):
-                    print(f"생성된 문서: {result.get('file_path')}")
-            else:
-                print(f"\n결과: 실패")
-                print(f"메시지: {result.get('message')}")
-                if result.get('violation'):
-                    print(f"위반 내용: {result.get('violation')}")
+            result = await asyncio.to_thread(web_agent.process_user_input, session_id, "예")
+        
+        return verification, result
+    
+    # 각 케이스는 세션이 분리되어 있으므로 동시에 실행
+    results = await asyncio.gather(*(run_case(i, tc) for i, tc in enumerate(test_cases, 1)))
+    
+    for i, (test_case, (verification, result)) in enumerate(zip(test_cases, results), 1):
+        print(f"\n{'='*50}")
+        print(f"테스트 {i}: {test_case['name']}")
+        print(f"{'='*50}\n")
+        
+        if verification is None:
+            continue
+        
+        print(f"문서 분류: {verification.get('doc_type')}")
+        print("분류 확인 응답: 예")
+        
+        if result.get('success'):
+            print(f"\n결과: {result.get('message', '성공')}")
+            if result.get('document'):
+                print(f"생성된 문서: {result.get('file_path')}")
+        else:
+            print(f"\n결과: 실패")
+            print(f"메시지: {result.get('message')}")
+            if result.get('violation'):
+                print(f"위반 내용: {result.get('violation')}")
 
 if __name__ == "__main__":
     # 로깅 설정
@@ -77,4 +88,4 @@ if __name__ == "__main__":
         format='%(message)s'
     )
     
-    asyncio.run(test_complete_workflow())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
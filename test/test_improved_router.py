@@ -2,26 +2,13 @@
 개선된 라우터 통합 테스트
 """
 import sys
-from pathlib import Path
 
-# 경로 설정
-project_root = Path(__file__).parent.parent
-backend_path = project_root / "backend"
-sys.path.insert(0, str(backend_path))
+import pytest
 
-print(f"프로젝트 루트: {project_root}")
-print(f"sys.path에 추가: {backend_path}")
-
-# 임포트
-from app.services.router_agent.classifier import AgentClassifier
-from app.services.router_agent.router import RouterAgent
-
-def test_classifier_improved():
+def test_classifier_improved(classifier):
     """개선된 분류기 테스트"""
     print("\n=== 분류기 개선 테스트 ===")
     
-    classifier = AgentClassifier()
-    
     test_cases = [
         ("영업방문 결과보고서 작성해줘", "docs_agent"),
         ("김도윤 직원의 실적을 분석해줘", "employee_agent"),
@@ -43,12 +30,10 @@ def test_classifier_improved():
             print(f"  LLM 분석: {llm_analysis.get('agent', 'N/A')}")
             print(f"  LLM 이유: {llm_analysis.get('reasoning', 'N/A')}")
 
-def test_router_without_interrupt():
+def test_router_without_interrupt(router):
     """인터럽트 없는 라우터 테스트"""
     print("\n\n=== 라우터 테스트 (인터럽트 회피) ===")
     
-    router = RouterAgent()
-    
     # employee_agent는 인터럽트가 없으므로 성공해야 함
     test_query = "김도윤 직원의 2024년 실적 분석해줘"
     
@@ -72,12 +57,10 @@ def test_router_without_interrupt():
             print(f"  기간: {data.get('period')}")
             print(f"  총 실적: {data.get('total_performance', 0):,}원")
 
-def test_docs_agent_classification():
+def test_docs_agent_classification(router):
     """docs_agent 분류만 테스트"""
     print("\n\n=== docs_agent 분류 테스트 ===")
     
-    router = RouterAgent()
-    
     # 명확한 문서 작성 요청
     test_query = "영업방문 결과보고서를 작성하고 싶어요. 오늘 ABC병원을 방문했습니다."
     
@@ -105,8 +88,4 @@ def test_docs_agent_classification():
     print(f"신뢰도: {state.get('classification_confidence', 0):.2f}")
 
 if __name__ == "__main__":
-    test_classifier_improved()
-    test_router_without_interrupt()
-    test_docs_agent_classification()
-    
-    print("\n\n테스트 완료!")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -1,16 +1,11 @@
 """
 RouterAgent 분류 테스트
 """
-import asyncio
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.app.services.router_agent.router_agent import RouterAgent
+import pytest
 
-async def test_router():
-    router = RouterAgent()
-    
+def test_router(router):
     test_queries = [
         "영업방문결과보고서 작성해줘",
         "영업방문 결과보고서 작성해줘",
@@ -21,11 +16,13 @@ async def test_router():
     
     print("=== RouterAgent 분류 테스트 ===\n")
     
-    for query in test_queries:
-        result = await router.classify(query)
+    # 질문들을 묶어서 한 번에 분류
+    results = router.classify_batch(test_queries)
+    
+    for query, result in zip(test_queries, results):
         print(f"질문: {query}")
         print(f"분류 결과: {result}")
         print("-" * 50)
 
 if __name__ == "__main__":
-    asyncio.run(test_router())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
@@ -3,57 +3,50 @@
 1. 각 에이전트로 분류가 잘 되는지 검증
 2. docs_agent가 잘 작동하는지 검증
 """
+import io
 import sys
-from pathlib import Path
 import asyncio
-import json
-from typing import Dict, Any
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from conftest import TestColors
 
 # 경로 설정
 project_root = Path(__file__).parent.parent
 backend_path = project_root / "backend"
 app_path = backend_path / "app"
 
-# sys.path에 추가
-sys.path.insert(0, str(backend_path))
-sys.path.insert(0, str(app_path))
-
-# 필요한 모듈 임포트
-from app.services.router_agent import RouterAgent, AgentClassifier
-from app.services.docs_agent.create_document_agent import CreateDocumentAgent
-from app.services.employee_agent.employee_agent import EnhancedEmployeeAgent
 
+@pytest.fixture
+def out():
+    """테스트 출력 버퍼 - 줄마다 stdout에 쓰지 않고 테스트 종료 시 한 번에 출력"""
+    buffer = io.StringIO()
+    yield buffer
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
 
-class TestColors:
-    """테스트 출력용 색상"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
 
-
-def print_test_header(test_name: str):
+def print_test_header(out, test_name: str):
     """테스트 헤더 출력"""
-    print(f"\n{TestColors.BOLD}{TestColors.BLUE}{'='*60}")
-    print(f"테스트: {test_name}")
-    print(f"{'='*60}{TestColors.RESET}")
+    print(f"\n{TestColors.BOLD}{TestColors.BLUE}{'='*60}", file=out)
+    print(f"테스트: {test_name}", file=out)
+    print(f"{'='*60}{TestColors.RESET}", file=out)
 
 
-def print_result(success: bool, message: str):
+def print_result(out, success: bool, message: str):
     """테스트 결과 출력"""
     if success:
-        print(f"{TestColors.GREEN}[PASS] {message}{TestColors.RESET}")
+        print(f"{TestColors.GREEN}[PASS] {message}{TestColors.RESET}", file=out)
     else:
-        print(f"{TestColors.RED}[FAIL] {message}{TestColors.RESET}")
+        print(f"{TestColors.RED}[FAIL] {message}{TestColors.RESET}", file=out)
 
 
-def test_agent_classifier():
+def test_agent_classifier(classifier, out):
     """에이전트 분류기 테스트"""
-    print_test_header("에이전트 분류기 테스트")
-    
-    classifier = AgentClassifier()
+    print_test_header(out, "에이전트 분류기 테스트")
     
     # 테스트 케이스
     test_cases = [
@@ -105,136 +98,141 @@ def test_agent_classifier():
     # 테스트 실행
     success_count = 0
     total_count = len(test_cases)
+    mismatches = []
+    
+    # 분류는 LLM 응답 대기가 대부분이므로 스레드로 동시에 실행 (분류기 캐시는 락으로 보호됨)
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        results = list(executor.map(lambda test_case: classifier.classify(test_case["query"]), test_cases))
     
-    for test_case in test_cases:
+    for test_case, (agent, confidence, analysis) in zip(test_cases, results):
         query = test_case["query"]
         expected = test_case["expected"]
         description = test_case["description"]
         
-        print(f"\n{TestColors.YELLOW}[테스트] {description}{TestColors.RESET}")
-        print(f"질문: {query}")
-        
-        # 분류 실행
-        agent, confidence, analysis = classifier.classify(query)
+        print(f"\n{TestColors.YELLOW}[테스트] {description}{TestColors.RESET}", file=out)
+        print(f"질문: {query}", file=out)
         
         # 결과 확인
         is_correct = agent == expected
         success_count += 1 if is_correct else 0
+        if not is_correct:
+            mismatches.append(f"{description}: 예상 {expected}, 결과 {agent}")
         
-        print_result(is_correct, f"예상: {expected}, 결과: {agent} (신뢰도: {confidence:.2f})")
+        print_result(out, is_correct, f"예상: {expected}, 결과: {agent} (신뢰도: {confidence:.2f})")
+        print(f"  의미 기반 캐시: {'HIT' if 'semantic_cache' in analysis else 'MISS'}", file=out)
         
         # 상세 분석 정보
         if not is_correct:
-            print(f"  키워드 분석: {analysis.get('keyword_analysis', {}).get('matched_keywords', [])}")
-            print(f"  LLM 분석: {analysis.get('llm_analysis', {}).get('reasoning', 'N/A')}")
+            print(f"  키워드 분석: {analysis.get('keyword_analysis', {}).get('matched_keywords', [])}", file=out)
+            print(f"  LLM 분석: {analysis.get('llm_analysis', {}).get('reasoning', 'N/A')}", file=out)
     
     # 최종 결과
-    print(f"\n{TestColors.BOLD}분류 테스트 결과: {success_count}/{total_count} 성공{TestColors.RESET}")
-    return success_count == total_count
+    print(f"\n{TestColors.BOLD}분류 테스트 결과: {success_count}/{total_count} 성공{TestColors.RESET}", file=out)
+    assert not mismatches, "분류 오류:\n" + "\n".join(mismatches)
 
 
-def test_router_agent():
+async def test_router_agent(router, out):
     """라우터 에이전트 통합 테스트"""
-    print_test_header("라우터 에이전트 통합 테스트")
-    
-    router = RouterAgent()
+    print_test_header(out, "라우터 에이전트 통합 테스트")
     
     # 테스트 케이스
-    test_queries = [
-        "영업방문 결과보고서 작성해줘 방문일은 2025년 1월 15일이야",
-        "김도윤 직원의 이번 분기 실적을 분석해줘"
+    test_cases = [
+        ("영업방문 결과보고서 작성해줘 방문일은 2025년 1월 15일이야", "docs_agent"),
+        ("김도윤 직원의 이번 분기 실적을 분석해줘", "employee_agent")
     ]
     
-    for query in test_queries:
-        print(f"\n{TestColors.YELLOW}[통합 테스트] {query[:30]}...{TestColors.RESET}")
-        
-        try:
-            # 라우터 실행
-            result = router.run(query)
-            
-            print(f"세션 ID: {result.get('session_id')}")
-            print(f"대상 에이전트: {result.get('target_agent')}")
-            print(f"분류 신뢰도: {result.get('classification_confidence', 0):.2f}")
-            print(f"성공 여부: {result.get('success')}")
-            
-            if result.get('requires_interrupt'):
-                print(f"{TestColors.YELLOW}인터럽트 발생 - 사용자 입력 필요{TestColors.RESET}")
-            
-            if result.get('error'):
-                print(f"{TestColors.RED}오류: {result.get('error')}{TestColors.RESET}")
-            
-        except Exception as e:
-            print(f"{TestColors.RED}테스트 실행 중 오류: {str(e)}{TestColors.RESET}")
-            import traceback
-            traceback.print_exc()
-
-
-def test_docs_agent_direct():
-    """docs_agent 직접 테스트"""
-    print_test_header("docs_agent 직접 테스트")
+    # 각 질문은 독립 세션이므로 동시에 실행
+    results = await _run_all(router, [query for query, _ in test_cases])
+    failures = []
     
-    try:
-        agent = CreateDocumentAgent()
+    for (query, expected_agent), result in zip(test_cases, results):
+        print(f"\n{TestColors.YELLOW}[통합 테스트] {query[:30]}...{TestColors.RESET}", file=out)
         
-        # 테스트 쿼리
-        test_query = """
-        영업방문 결과보고서 작성해줘.
-        방문 제목은 ABC병원 신약 소개,
-        방문일은 2025년 1월 15일,
-        client는 ABC병원,
-        방문site는 서울시 강남구,
-        담당자는 김철수 과장이야.
-        """
+        if isinstance(result, Exception):
+            print(f"{TestColors.RED}테스트 실행 중 오류: {str(result)}{TestColors.RESET}", file=out)
+            failures.append(f"{query[:30]}: 예외 {result!r}")
+            continue
         
-        print(f"테스트 쿼리: {test_query[:50]}...")
+        if result.get('target_agent') != expected_agent:
+            failures.append(f"{query[:30]}: 예상 {expected_agent}, 결과 {result.get('target_agent')}")
         
-        # 에이전트 실행
-        result = agent.run(user_input=test_query)
+        print(f"세션 ID: {result.get('session_id')}", file=out)
+        print(f"대상 에이전트: {result.get('target_agent')}", file=out)
+        print(f"분류 신뢰도: {result.get('classification_confidence', 0):.2f}", file=out)
+        print(f"성공 여부: {result.get('success')}", file=out)
         
-        if result.get("success"):
-            print_result(True, "문서 생성 성공")
-            print(f"생성된 문서: {result.get('result', {}).get('final_doc', 'N/A')}")
-        elif result.get("thread_id"):
-            print(f"{TestColors.YELLOW}인터럽트 발생{TestColors.RESET}")
-            print(f"스레드 ID: {result.get('thread_id')}")
-            print("사용자 입력이 필요합니다.")
-            
-            # 인터럽트 시뮬레이션
-            print("\n인터럽트 처리 시뮬레이션...")
-            
-            # 1. 분류 확인에 "네" 응답
-            resume_result = agent.resume(
-                thread_id=result["thread_id"],
-                user_reply="네",
-                input_type="verification_reply"
-            )
-            
-            if resume_result.get("success"):
-                print_result(True, "인터럽트 처리 완료")
-            else:
-                print_result(False, "인터럽트 처리 실패")
-                
-        else:
-            print_result(False, f"실행 실패: {result.get('error', 'Unknown error')}")
-            
-    except Exception as e:
-        print_result(False, f"예외 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if result.get('requires_interrupt'):
+            print(f"{TestColors.YELLOW}인터럽트 발생 - 사용자 입력 필요{TestColors.RESET}", file=out)
+        
+        if result.get('error'):
+            print(f"{TestColors.RED}오류: {result.get('error')}{TestColors.RESET}", file=out)
+    
+    assert not failures, "라우팅 오류:\n" + "\n".join(failures)
 
 
-def test_path_issues():
+async def _run_all(router, queries):
+    """모든 질문을 라우터 비동기 실행으로 동시에 처리 (예외는 결과로 반환)"""
+    return await asyncio.gather(*(router.arun(q) for q in queries), return_exceptions=True)
+
+
+def test_docs_agent_direct(agent, out):
+    """docs_agent 직접 테스트"""
+    print_test_header(out, "docs_agent 직접 테스트")
+    
+    # 테스트 쿼리
+    test_query = """
+    영업방문 결과보고서 작성해줘.
+    방문 제목은 ABC병원 신약 소개,
+    방문일은 2025년 1월 15일,
+    client는 ABC병원,
+    방문site는 서울시 강남구,
+    담당자는 김철수 과장이야.
+    """
+    
+    print(f"테스트 쿼리: {test_query[:50]}...", file=out)
+    
+    # 에이전트 실행
+    result = agent.run(user_input=test_query)
+    
+    if result.get("success"):
+        print_result(out, True, "문서 생성 성공")
+        print(f"생성된 문서: {result.get('result', {}).get('final_doc', 'N/A')}", file=out)
+        return
+    
+    if not result.get("thread_id"):
+        print_result(out, False, f"실행 실패: {result.get('error', 'Unknown error')}")
+    assert result.get("thread_id"), f"실행 실패: {result.get('error', 'Unknown error')}"
+    
+    print(f"{TestColors.YELLOW}인터럽트 발생{TestColors.RESET}", file=out)
+    print(f"스레드 ID: {result.get('thread_id')}", file=out)
+    print("사용자 입력이 필요합니다.", file=out)
+    
+    # 인터럽트 시뮬레이션
+    print("\n인터럽트 처리 시뮬레이션...", file=out)
+    
+    # 1. 분류 확인에 "네" 응답
+    resume_result = agent.resume(
+        thread_id=result["thread_id"],
+        user_reply="네",
+        input_type="verification_reply"
+    )
+    
+    print_result(out, bool(resume_result.get("success")), "인터럽트 처리")
+    assert resume_result.get("success"), f"인터럽트 처리 실패: {resume_result.get('error', 'Unknown error')}"
+
+
+def test_path_issues(out):
     """경로 및 임포트 문제 확인"""
-    print_test_header("경로 및 임포트 검증")
+    print_test_header(out, "경로 및 임포트 검증")
     
     # 1. 경로 확인
-    print("\n1. 경로 확인:")
-    print(f"프로젝트 루트: {project_root}")
-    print(f"백엔드 경로: {backend_path}")
-    print(f"앱 경로: {app_path}")
+    print("\n1. 경로 확인:", file=out)
+    print(f"프로젝트 루트: {project_root}", file=out)
+    print(f"백엔드 경로: {backend_path}", file=out)
+    print(f"앱 경로: {app_path}", file=out)
     
     # 2. 중요 파일 존재 확인
-    print("\n2. 중요 파일 존재 확인:")
+    print("\n2. 중요 파일 존재 확인:", file=out)
     important_files = [
         app_path / "services" / "router_agent" / "router.py",
         app_path / "services" / "router_agent" / "classifier.py",
@@ -245,50 +243,34 @@ def test_path_issues():
         app_path / "api" / "router_api.py"
     ]
     
+    # 파일마다 stat 하지 않고 앱 디렉토리를 한 번 순회하여 집합으로 확인
+    existing = set(app_path.rglob("*.py"))
+    missing = [file_path for file_path in important_files if file_path not in existing]
     for file_path in important_files:
-        exists = file_path.exists()
-        print_result(exists, f"{file_path.relative_to(project_root)}")
+        print_result(out, file_path in existing, f"{file_path.relative_to(project_root)}")
     
     # 3. 임포트 테스트
-    print("\n3. 임포트 테스트:")
+    print("\n3. 임포트 테스트:", file=out)
     imports_to_test = [
-        ("common.state", "from app.services.common.state import BaseState"),
-        ("router_agent", "from app.services.router_agent import RouterAgent"),
-        ("classifier", "from app.services.router_agent.classifier import AgentClassifier"),
-        ("docs_agent", "from app.services.docs_agent.create_document_agent import CreateDocumentAgent"),
-        ("employee_agent", "from app.services.employee_agent.employee_agent import EnhancedEmployeeAgent")
+        ("common.state", "app.services.common.state", "BaseState"),
+        ("router_agent", "app.services.router_agent", "RouterAgent"),
+        ("classifier", "app.services.router_agent.classifier", "AgentClassifier"),
+        ("docs_agent", "app.services.docs_agent.create_document_agent", "CreateDocumentAgent"),
+        ("employee_agent", "app.services.employee_agent.employee_agent", "EnhancedEmployeeAgent")
     ]
     
-    for name, import_stmt in imports_to_test:
+    import_failures = []
+    for name, module_path, attr in imports_to_test:
         try:
-            exec(import_stmt)
-            print_result(True, f"{name} 임포트 성공")
+            getattr(importlib.import_module(module_path), attr)
+            print_result(out, True, f"{name} 임포트 성공")
         except Exception as e:
-            print_result(False, f"{name} 임포트 실패: {str(e)}")
-
-
-def main():
-    """메인 테스트 실행"""
-    print(f"{TestColors.BOLD}{TestColors.BLUE}")
-    print("="*60)
-    print("라우터 시스템 통합 테스트")
-    print("="*60)
-    print(TestColors.RESET)
-    
-    # 경로 검증
-    test_path_issues()
-    
-    # 분류기 테스트
-    classifier_success = test_agent_classifier()
-    
-    # 라우터 통합 테스트
-    test_router_agent()
-    
-    # docs_agent 직접 테스트
-    test_docs_agent_direct()
+            print_result(out, False, f"{name} 임포트 실패: {str(e)}")
+            import_failures.append(f"{name}: {e}")
     
-    print(f"\n{TestColors.BOLD}테스트 완료!{TestColors.RESET}")
+    assert not missing, f"누락된 파일: {missing}"
+    assert not import_failures, "임포트 실패:\n" + "\n".join(import_failures)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -1,16 +1,11 @@
 """
 RouterAgent 긴 쿼리 테스트
 """
-import asyncio
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.app.services.router_agent.router_agent import RouterAgent
+import pytest
 
-async def test_long_queries():
-    router = RouterAgent()
-    
+def test_long_queries(router):
     # 실제 문제가 되었던 쿼리들
     test_queries = [
         # 22%% 포함된 쿼리
@@ -22,14 +17,15 @@ async def test_long_queries():
     
     print("=== RouterAgent 긴 쿼리 테스트 ===\n")
     
-    for i, query in enumerate(test_queries):
+    # 쿼리들을 묶어서 한 번에 분류
+    results = router.classify_batch(test_queries)
+    
+    for i, (query, result) in enumerate(zip(test_queries, results)):
         print(f"테스트 {i+1}:")
         print(f"쿼리 길이: {len(query)}자")
         print(f"쿼리 시작: {query[:50]}...")
-        
-        result = await router.classify(query)
         print(f"분류 결과: {result}")
         print("-" * 80)
 
 if __name__ == "__main__":
-    asyncio.run(test_long_queries())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
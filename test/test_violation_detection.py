@@ -1,9 +1,14 @@
 """
 규정 위반 감지 개선 테스트
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import re
+
+import pytest
+
+from fixtures.keyword_scanner import build_scanner
+from fixtures.korean_content import (
+    YUMI_VISIT_REPORT, YUMI_VISIT_REPORT_UTF8, SHORT_LOYALTY_REQUEST, SHORT_LOYALTY_REQUEST_UTF8
+)
 
 # 테스트용 위반 문구들
 VIOLATION_KEYWORDS = [
@@ -19,56 +24,90 @@ VIOLATION_KEYWORDS = [
     "골프"
 ]
 
-def enhanced_violation_check(content: str) -> str:
-    """향상된 규정 위반 검사"""
+# 주류 관련 문구들
+ALCOHOL_KEYWORDS = ["술", "주류", "소주", "맥주", "와인", "위스키"]
+
+# 금액 표기 ("5만원", "5만 원", "50000원") - 숫자와 "만" 단위를 그룹으로 분리
+_AMOUNT_RE = re.compile(r'(\d+)(?:(만)\s*)?원')
+
+# (분류, 키워드) 목록 - 매칭 엔진의 패턴 ID는 이 목록의 인덱스
+_KEYWORD_ENTRIES = [("violation", keyword) for keyword in VIOLATION_KEYWORDS] + \
+                   [("alcohol", keyword) for keyword in ALCOHOL_KEYWORDS]
+
+# 모든 키워드를 한 번의 스캔으로 찾기 위한 매칭 엔진 (설치된 엔진 중 가장 빠른 것)
+_SCANNER = build_scanner(_KEYWORD_ENTRIES)
+
+def _find_keywords(content: str, encoded: bytes = None) -> set:
+    """본문에 포함된 (분류, 키워드) 집합 반환 (encoded: 미리 인코딩한 UTF-8 본문)"""
+    return _SCANNER.find_all(content, encoded)
+
+def _first_keyword(content: str, encoded: bytes = None):
+    """본문에서 가장 앞에 나오는 (분류, 키워드) 반환, 없으면 None"""
+    return _SCANNER.first(content, encoded)
+
+def _keyword_violation(category: str, keyword: str) -> str:
+    """키워드 위반 메시지"""
+    if category == "alcohol":
+        return f"주류({keyword}) 관련 내용이 포함되어 있습니다"
+    return f"'{keyword}' 관련 내용이 포함되어 있습니다"
+
+def _format_violations(violations: list) -> str:
+    """위반 목록을 검사 결과 문자열로 변환"""
+    if violations:
+        return "다음 규정 위반 사항이 발견되었습니다:\n" + "\n".join(f"- {v}" for v in violations)
+    return "OK"
+
+def enhanced_violation_check(content: str, mode: str = "all", encoded: bytes = None) -> str:
+    """
+    향상된 규정 위반 검사
+    
+    Args:
+        content: 검사할 본문
+        mode: "all" - 모든 위반 사항 보고 (감사 로그용)
+              "first" - 첫 위반 발견 즉시 중단 (문서 생성 차단 여부 판단용)
+        encoded: 미리 인코딩한 UTF-8 본문 (있으면 키워드 스캔 시 재인코딩 생략)
+    """
+    if mode == "first":
+        entry = _first_keyword(content, encoded)
+        if entry is not None:
+            return _format_violations([_keyword_violation(*entry)])
+        
+        for match in _AMOUNT_RE.finditer(content):
+            if int(match.group(1)) * (10000 if match.group(2) else 1) >= 50000:
+                return _format_violations([f"고액({match.group(0)})의 지출이 포함되어 있습니다"])
+        return "OK"
+    
     violations = []
+    hits = _find_keywords(content, encoded)
     
-    # 키워드 기반 검사
+    # 키워드 기반 검사 (보고 순서는 키워드 목록 순서 유지)
     for keyword in VIOLATION_KEYWORDS:
-        if keyword in content:
-            violations.append(f"'{keyword}' 관련 내용이 포함되어 있습니다")
+        if ("violation", keyword) in hits:
+            violations.append(_keyword_violation("violation", keyword))
     
     # 금액 관련 검사
-    import re
-    amounts = re.findall(r'(\d+만\s*원|\d+원)', content)
-    for amount in amounts:
-        # 금액 추출
-        num = int(re.search(r'\d+', amount).group())
-        if '만' in amount:
-            num *= 10000
+    for match in _AMOUNT_RE.finditer(content):
+        num = int(match.group(1)) * (10000 if match.group(2) else 1)
         
         if num >= 50000:  # 5만원 이상
-            violations.append(f"고액({amount})의 지출이 포함되어 있습니다")
+            violations.append(f"고액({match.group(0)})의 지출이 포함되어 있습니다")
     
     # 주류 관련 검사
-    alcohol_keywords = ["술", "주류", "소주", "맥주", "와인", "위스키"]
-    for keyword in alcohol_keywords:
-        if keyword in content:
-            violations.append(f"주류({keyword}) 관련 내용이 포함되어 있습니다")
+    for keyword in ALCOHOL_KEYWORDS:
+        if ("alcohol", keyword) in hits:
+            violations.append(_keyword_violation("alcohol", keyword))
     
-    if violations:
-        return "다음 규정 위반 사항이 발견되었습니다:\n" + "\n".join(f"- {v}" for v in violations)
-    else:
-        return "OK"
+    return _format_violations(violations)
 
 def test_enhanced_check():
     """테스트 실행"""
-    test_content = """영업방문결과서 작성해줘. 내용은 방문 제목은 유미가정의학과 신약 홍보이고 
-    방문일은 250725이고 client는 유미가정의학과 방문사이트는 www.yumibanplz.com 
-    담담자는 손현성이고 소속은 영업팀 연락처는 010-1234-5678이야 
-    영업제공자는 김도윤이고 연락처는 010-8765-4321이야 
-    방문자는 허한결이고 소속은 영업팀이야 
-    고객사 개요는 이번에 새로 오픈한 가정의학과로 사용 약품에 대해 많은 논의가 필요해보이는 잠재력이 있는 고객이야 
-    프로젝트 개요는 신규고객 유치로 자사 약품홍보 후 로얄티 및 메리트 소개를 할거야 
-    방문 및 협의 내용은 자사 약품 소개와 로얄티 및 자사 약품 사용시 메리트를 소개하였음 
-    향후계획및일정은 7월 27일에 다시 방문하여 자사 판촉물 전달과 로얄티 협상을 할 예정이야 
-    협조사항으로 자사 판촉물 1개 지급 요망"""
+    test_content = YUMI_VISIT_REPORT
     
     print("=== 향상된 규정 위반 검사 테스트 ===\n")
     print("테스트 내용:")
     print(test_content[:100] + "...\n")
     
-    result = enhanced_violation_check(test_content)
+    result = enhanced_violation_check(test_content, encoded=YUMI_VISIT_REPORT_UTF8)
     print("검사 결과:")
     print(result)
     
@@ -76,6 +115,29 @@ def test_enhanced_check():
         print("\n[성공] 규정 위반이 정상적으로 감지되었습니다!")
     else:
         print("\n[실패] 규정 위반을 감지하지 못했습니다.")
+    
+    # 조기 종료 모드는 첫 위반 하나만 보고
+    first_result = enhanced_violation_check(test_content, mode="first", encoded=YUMI_VISIT_REPORT_UTF8)
+    print("\n조기 종료 모드 검사 결과:")
+    print(first_result)
+    assert result != "OK"
+    # 본문에 가장 먼저 나오는 위반 키워드는 '로얄티' (목록 첫 항목인 '자사 판촉물'은 더 뒤에 등장)
+    assert first_result == _format_violations([_keyword_violation("violation", "로얄티")])
+
+@pytest.mark.parametrize("backend", ["hyperscan", "ahocorasick"])
+def test_scanner_backend_matches_substring(backend):
+    """가속 엔진의 검사 결과가 부분 문자열 검사와 같은지 확인 (엔진 미설치 시 건너뜀)"""
+    pytest.importorskip(backend)
+    scanner = build_scanner(_KEYWORD_ENTRIES, backend)
+    reference = build_scanner(_KEYWORD_ENTRIES, "substring")
+    
+    for content, encoded in [
+        (YUMI_VISIT_REPORT, YUMI_VISIT_REPORT_UTF8),
+        (SHORT_LOYALTY_REQUEST, SHORT_LOYALTY_REQUEST_UTF8),
+        ("위반 사항이 없는 본문", None),
+    ]:
+        assert scanner.find_all(content, encoded) == reference.find_all(content)
+        assert scanner.first(content, encoded) == reference.first(content)
 
 if __name__ == "__main__":
     test_enhanced_check()
\ No newline at end of file
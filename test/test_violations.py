@@ -0,0 +1,59 @@
+"""
+규정 위반 테스트
+문서 작성 에이전트에 위반 내용이 포함된 요청을 보내고 위반 감지 결과를 확인합니다.
+"""
+import sys
+
+import pytest
+
+# (세션 이름, 요청 내용, 위반 결과에 포함되어야 할 키워드)
+VIOLATION_CASES = [
+    (
+        "loyalty",
+        '''영업방문결과서 작성해줘.
+    프로젝트 개요는 신규고객 유치로 자사 약품홍보 후 로얄티 및 메리트 소개를 할거야
+    방문 및 협의 내용은 자사 약품 소개와 로얄티 및 자사 약품 사용시 메리트를 소개하였음''',
+        "로얄티"
+    ),
+    (
+        "policy_wine",
+        '''제품설명회 결과보고서 작성해줘.
+    행사 후 저녁식사를 가졌고 메뉴는 스테이크였어.
+    사용한 금액은 200만원이고 주류는 와인 10병을 마셨어.
+    인당 금액은 20만원이 나왔어.''',
+        "와인"
+    ),
+    (
+        "policy_cash",
+        '''영업방문결과서 작성해줘.
+    방문일은 250725이고 client는 유미가정의학과야.
+    방문 내용은 자사 약품 사용시 현금 50만원을 지급하기로 협의했어.
+    향후 계획은 다음주에 현금을 전달할 예정이야.''',
+        "현금"
+    ),
+]
+
+@pytest.mark.parametrize("name,content,expected", VIOLATION_CASES, ids=[case[0] for case in VIOLATION_CASES])
+async def test_violation_stream(agent, name, content, expected):
+    """문서 작성 에이전트의 스트리밍 실행으로 LLM 출력을 받는 대로 표시하며 위반 감지 확인"""
+    thread_id = f"test_stream_{name}"
+
+    print(f"=== 규정 위반 스트리밍 테스트 ({name}) ===\n")
+    await _stream_violation_check(agent, thread_id, content)
+
+    violation = agent.app.get_state({"configurable": {"thread_id": thread_id}}).values.get("violation")
+    print('\n- 위반:', violation)
+    assert violation, "규정 위반이 감지되지 않았습니다"
+    assert expected in violation
+
+async def _stream_violation_check(agent, thread_id, content):
+    """요청 → 분류 확인 '예' 응답까지 LLM 토큰을 생성되는 대로 출력"""
+    async for chunk in agent.astream(content, thread_id):
+        print(chunk, end="", flush=True)
+
+    print('\n[예 응답]')
+    async for chunk in agent.astream_resume(thread_id, '예', 'verification_reply'):
+        print(chunk, end="", flush=True)
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
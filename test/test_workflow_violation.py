@@ -2,10 +2,10 @@
 워크플로우에서 규정 위반 차단 테스트
 """
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.app.services.docs_agent import run
+import pytest
+
+from app.services.docs_agent import run
 
 async def test_violation_blocking():
     """규정 위반 시 문서 생성 차단 테스트"""
@@ -58,5 +58,4 @@ async def test_violation_blocking():
             print("\n[성공] 규정 위반으로 인해 문서 생성이 차단되었습니다!")
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(test_violation_blocking())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file